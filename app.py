@@ -15,11 +15,11 @@ import urllib.request
 from collections import Counter, defaultdict
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
 import numpy as np
-import jieba
 from PIL import Image
-from wordcloud import WordCloud
+
+# plotly / wordcloud / jieba 体量较大且仅在上传数据后才用到，
+# 延迟到实际使用处导入，缩短上传前页面的冷启动时间
 
 # 用于 PDF 图表导出：无界面后端，避免 kaleido 不可用时无图
 import matplotlib
@@ -47,6 +47,7 @@ from data_processor import (
     get_person_behavior_scores,
     get_all_behavior_avgs,
     get_person_total_and_dims,
+    find_uniform_response_rows,
 )
 from pdf_generator import PDFReport, REPORTLAB_AVAILABLE, REPORTLAB_IMPORT_ERROR
 
@@ -249,6 +250,7 @@ def _extract_pain_point_keywords(phrases: list, top_n: int = 20, min_word_len: i
     """仅在管理痛点相关片段中统计词频，返回 (词, 频次) 列表。标点不纳入统计。"""
     if not phrases:
         return []
+    import jieba
     combined = " ".join(phrases)
     segs = jieba.lcut(combined)
     single_char_stop = {"的", "了", "是", "在", "我", "有", "和", "就", "不", "人", "都", "一", "上", "也", "很", "到", "说", "要", "去", "你", "会", "着", "没", "看", "好", "自", "这", "那", "等", "能", "与", "及", "或", "而", "把", "被", "让", "给", "无", "可", "以", "够", "些", "什", "么", "怎", "如", "为"}
@@ -404,6 +406,8 @@ def build_wordcloud_image(text: str, width=900, height=380, mask_dir: str = None
     text = (text or "").strip()
     if not text:
         return None, [], None
+    import jieba
+    from wordcloud import WordCloud
     segs = jieba.lcut(text)
     single_char_stop = {"的", "了", "是", "在", "我", "有", "和", "就", "不", "人", "都", "一", "上", "也", "很", "到", "说", "要", "去", "你", "会", "着", "没", "看", "好", "自", "这", "那", "等", "能", "与", "及", "或", "而", "把", "被", "让", "给", "无", "可", "以", "够", "些", "什", "么", "怎", "如", "为"}
     words = []
@@ -1136,6 +1140,9 @@ if not uploaded:
     st.markdown("**文件要求**：表头含问卷题目、至少一列「填写人」或「姓名」，选项为五级量表。")
     st.stop()
 
+# 上传数据后才需要绘图，此时再导入 plotly（模块级导入约 200ms）
+import plotly.graph_objects as go
+
 # ---------- 数据加载（逻辑不变） ----------
 @st.cache_data
 def load_and_process(uploaded_file):
@@ -1485,15 +1492,11 @@ with st.sidebar:
                 anomaly_rows = []
                 name_col_anom = next((c for c in ["填写人", "姓名", "学员姓名"] if c in df.columns), None)
                 dept_col_anom = "部门" if "部门" in df.columns else None
-                for idx in df_q_pdf.index:
-                    row = df_q_pdf.loc[idx, score_cols]
-                    valid = row.dropna()
-                    if len(valid) >= 1 and valid.nunique() == 1:
-                        uniform_score = float(valid.iloc[0])
-                        name = df.loc[idx, name_col_anom] if name_col_anom else str(idx)
-                        dept = df.loc[idx, dept_col_anom] if dept_col_anom else None
-                        note = f"该伙伴所有题目均为 {uniform_score:.1f} 分，建议管理者关注。"
-                        anomaly_rows.append((name, dept, uniform_score, note))
+                for idx, uniform_score in find_uniform_response_rows(df_q_pdf, score_cols):
+                    name = df.loc[idx, name_col_anom] if name_col_anom else str(idx)
+                    dept = df.loc[idx, dept_col_anom] if dept_col_anom else None
+                    note = f"该伙伴所有题目均为 {uniform_score:.1f} 分，建议管理者关注。"
+                    anomaly_rows.append((name, dept, uniform_score, note))
                 summary_votes = learning_module_votes_pdf
                 dim_means_all = df_dims_pdf[dim_cols].mean() if dim_cols else pd.Series(dtype=float)
                 avg_dims = [float(dim_means_all[c]) for c in dim_cols] if len(dim_cols) == 5 else None
@@ -2117,10 +2120,10 @@ with tab4:
         open_df = open_df.fillna("无")
         for c in open_cols:
             open_df[c] = open_df[c].astype(str).replace("nan", "无")
-        def has_content(val):
-            s = str(val).strip()
-            return s and s not in ("无", "-", "—")
-        mask = open_df[open_cols].apply(lambda row: any(has_content(row[c]) for c in open_cols), axis=1)
+        # 向量化判断「有效反馈」：整体 strip 后与无效值集合做 isin，避免逐行 apply
+        NONCONTENT = {"", "无", "-", "—", "nan", "None"}
+        stripped = open_df[open_cols].astype(str).apply(lambda s: s.str.strip())
+        mask = ~stripped.isin(NONCONTENT).all(axis=1)
         open_df = open_df[mask].reset_index(drop=True)
         if open_df.empty:
             st.caption("暂无有效开放反馈（已填写「无」或为空的记录不展示）")
@@ -2138,13 +2141,7 @@ with tab5:
     st.markdown("#### 异常名单 · 建议管理者关注")
     st.caption("单选题（量表题）若全部为同一分值，则视为异常，可能存在应付填答，建议关注。")
     score_cols = list(col_to_cat_be.keys())
-    anomaly_rows = []
-    for idx in df_q.index:
-        row = df_q.loc[idx, score_cols]
-        valid = row.dropna()
-        if len(valid) >= 1 and valid.nunique() == 1:
-            uniform_score = float(valid.iloc[0])
-            anomaly_rows.append((idx, uniform_score))
+    anomaly_rows = find_uniform_response_rows(df_q, score_cols)
     name_col_anom = next((c for c in ["填写人", "姓名", "学员姓名"] if c in df.columns), None)
     dept_col_anom = "部门" if "部门" in df.columns else None
     if not anomaly_rows:
@@ -60,19 +60,27 @@ def compute_dimension_scores(df_scores: pd.DataFrame, col_to_cat_be: dict):
     df_scores: 仅题目列，已为数值。
     返回：每人每维度平均分 DataFrame (index=原行索引, columns=维度名)
     """
-    rows = []
-    for idx in df_scores.index:
-        row = {}
-        for col, (cat, _) in col_to_cat_be.items():
-            if cat not in row:
-                row[cat] = []
-            v = df_scores.loc[idx, col]
-            if not pd.isna(v):
-                row[cat].append(v)
-        for cat in row:
-            row[cat] = np.mean(row[cat]) if row[cat] else np.nan
-        rows.append(row)
-    return pd.DataFrame(rows, index=df_scores.index)
+    # SoA 化：把得分整体转成 (N 人, Q 题) 的二维数组，列按维度重排成连续块，
+    # 每个维度的均分用一次 reduceat 归约完成，替代原先逐行逐列的 Python 循环。
+    cats = [col_to_cat_be[c][0] for c in df_scores.columns if c in col_to_cat_be]
+    cols = [c for c in df_scores.columns if c in col_to_cat_be]
+    if not cols:
+        return pd.DataFrame(index=df_scores.index)
+    cat_order = []
+    for cat in cats:
+        if cat not in cat_order:
+            cat_order.append(cat)
+    # 列按维度分块重排，保证每个维度在矩阵中连续
+    order = [i for cat in cat_order for i, c in enumerate(cats) if c == cat]
+    arr = df_scores[[cols[i] for i in order]].to_numpy(dtype=float, copy=False)
+    sizes = np.array([cats.count(cat) for cat in cat_order])
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    valid = ~np.isnan(arr)
+    sums = np.add.reduceat(np.where(valid, arr, 0.0), starts, axis=1)
+    counts = np.add.reduceat(valid.astype(np.int64), starts, axis=1)
+    with np.errstate(invalid="ignore"):
+        means = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+    return pd.DataFrame(means, index=df_scores.index, columns=cat_order)
 
 
 def compute_behavior_scores(df_scores: pd.DataFrame, col_to_cat_be: dict):
@@ -90,7 +98,14 @@ def compute_behavior_scores(df_scores: pd.DataFrame, col_to_cat_be: dict):
 
 def get_person_total_and_dims(df_scores: pd.DataFrame, df_dims: pd.DataFrame):
     """每人总分、各维度分（按 CATEGORY_ORDER）。"""
-    total = df_scores.mean(axis=1)
+    # 整块转 NumPy 后按有效值掩码求和/计数一次归约，绕开 pandas 逐行的 NaN
+    # 掩码路径；与 nanmean 等价，但全 NaN 行（未答任何量表题）不触发空切片告警
+    arr = df_scores.to_numpy(dtype=float, copy=False)
+    valid = ~np.isnan(arr)
+    counts = valid.sum(axis=1)
+    sums = np.where(valid, arr, 0.0).sum(axis=1)
+    means = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+    total = pd.Series(means, index=df_scores.index)
     dim_cols = [c for c in CATEGORY_ORDER if c in df_dims.columns]
     dim_scores = df_dims[dim_cols] if dim_cols else pd.DataFrame()
     return total, dim_scores
@@ -103,19 +118,35 @@ def get_behavior_avg_by_dimension(df_scores: pd.DataFrame, col_to_cat_be: dict):
 
 def get_person_behavior_scores(df_scores: pd.DataFrame, col_to_cat_be: dict, person_idx):
     """某学员在各行为项上的得分（用于折线图）。顺序与维度、行为一致。"""
-    labels = []
-    values = []
-    for col, (cat, be) in col_to_cat_be.items():
-        labels.append(f"{cat}-{be}")
-        values.append(df_scores.loc[person_idx, col])
+    cols = list(col_to_cat_be)
+    labels = [f"{cat}-{be}" for cat, be in col_to_cat_be.values()]
+    # 整行一次切片转 float 列表，替代逐列 .loc 标签查找
+    values = df_scores.loc[person_idx, cols].to_numpy(dtype=float).tolist()
     return labels, values
 
 
+def find_uniform_response_rows(df_scores: pd.DataFrame, cols):
+    """找出「全部题目同一分值」的填答行（疑似应付填答）。
+
+    返回 [(行索引, 统一分值), ...]。整表转 NumPy 后按行取有效值的 min/max，
+    一次比较代替逐行 dropna + nunique 的 Python 循环。
+    """
+    cols = [c for c in cols if c in df_scores.columns]
+    if not cols or df_scores.empty:
+        return []
+    arr = df_scores[cols].to_numpy(dtype=float, copy=False)
+    valid = ~np.isnan(arr)
+    counts = valid.sum(axis=1)
+    mins = np.where(valid, arr, np.inf).min(axis=1)
+    maxs = np.where(valid, arr, -np.inf).max(axis=1)
+    mask = (counts >= 1) & (mins == maxs)
+    index = df_scores.index
+    return [(index[i], float(mins[i])) for i in np.nonzero(mask)[0]]
+
+
 def get_all_behavior_avgs(df_scores: pd.DataFrame, col_to_cat_be: dict):
     """全员各行为项平均分，顺序与 get_person_behavior_scores 一致。"""
-    labels = []
-    values = []
-    for col, (cat, be) in col_to_cat_be.items():
-        labels.append(f"{cat}-{be}")
-        values.append(df_scores[col].mean())
+    cols = list(col_to_cat_be)
+    labels = [f"{cat}-{be}" for cat, be in col_to_cat_be.values()]
+    values = df_scores[cols].mean().to_numpy(dtype=float).tolist()
     return labels, values
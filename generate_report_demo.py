@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 """用原始底表生成一份静态 HTML 报告，便于查看输出效果（不依赖 Streamlit 运行）"""
 
+import hashlib
 import os
 import json
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
 from app_config import CATEGORY_ORDER, COLORS_BARS
 from data_processor import (
     clean_and_score,
@@ -15,51 +18,115 @@ from data_processor import (
     get_person_total_and_dims,
 )
 
+# base64 编码优先用 pybase64（SIMD 实现），未安装时退回标准库
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from base64 import b64encode as _b64encode
+
+# 图表 JSON 优先用 orjson（C 实现，数值数组可快 5~10 倍），未安装时退回标准库
+try:
+    import orjson
+
+    def _dumps(o):
+        return orjson.dumps(o, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+except ImportError:
+    # 紧凑分隔符省掉每个元素一个空格字节；中文标签保持 UTF-8 原文而非 \uXXXX 转义
+    def _dumps(o):
+        return json.dumps(o, separators=(",", ":"), ensure_ascii=False)
+
+
+def _sanitize_data(o):
+    """递归把 numpy 标量/数组就地转换为内置类型，供 json 序列化。"""
+    if isinstance(o, dict):
+        return {k: _sanitize_data(v) for k, v in o.items()}
+    if isinstance(o, (list, tuple)):
+        return [_sanitize_data(v) for v in o]
+    if isinstance(o, np.ndarray):
+        return o.tolist()
+    if hasattr(o, "item"):
+        return o.item()
+    return o
+
+
+def _sanitize_layout(o):
+    """layout 子树只含内置标量与少量嵌套 dict/list，跳过 numpy 类型探测。"""
+    if isinstance(o, dict):
+        return {k: _sanitize_layout(v) for k, v in o.items()}
+    if isinstance(o, (list, tuple)):
+        return [_sanitize_layout(v) for v in o]
+    return o
+
+
+def _typed(values):
+    """数值通道转 Plotly 类型化数组 {"bdata","dtype"}。
+
+    8 字节 double 的十进制文本约 20 字节，base64 一趟编码后体积缩到约 1/3，
+    且省去逐元素的小数格式化；需 plotly.js >= 3.0 解码。
+    """
+    arr = np.ascontiguousarray(np.asarray(values, dtype=np.float64))
+    return {"bdata": _b64encode(arr.tobytes()).decode("ascii"), "dtype": str(arr.dtype)}
+
 
 def fig_to_json_safe(fig):
     """Plotly 图转成可 JSON 序列化的 dict（处理 numpy 等类型）"""
     d = fig.to_dict()
-    return json.loads(json.dumps(d, default=lambda x: float(x) if hasattr(x, "item") else str(x)))
+    return {
+        **{k: _sanitize_data(v) for k, v in d.items() if k not in ("data", "layout")},
+        "data": _sanitize_data(d.get("data", [])),
+        "layout": _sanitize_layout(d.get("layout", {})),
+    }
 
 
-def main():
-    base = os.path.dirname(os.path.abspath(__file__))
-    path = os.path.join(base, "原始底表.xlsx")
-    if not os.path.isfile(path):
-        print("未找到 原始底表.xlsx")
-        return
-    df = pd.read_excel(path, sheet_name=0)
-    df_q, col_to_cat_be, _ = clean_and_score(df)
-    if df_q is None:
-        print("数据解析失败")
-        return
-    df_dims = compute_dimension_scores(df_q, col_to_cat_be)
-    total, _ = get_person_total_and_dims(df_q, df_dims)
-    name_col = "填写人" if "填写人" in df.columns else None
-    names = df[name_col].astype(str).tolist() if name_col else [f"学员{i+1}" for i in range(len(df))]
+# 图表 dict 直接手写，跳过 go.Figure 的全量 schema 校验；
+# 调试时设 REPORT_DEMO_VALIDATE=1 可让每个 dict 过一遍 plotly 校验
+_VALIDATE_FIGS = os.environ.get("REPORT_DEMO_VALIDATE", "") not in ("", "0")
+
+
+def _maybe_validate(fig_dict):
+    """REPORT_DEMO_VALIDATE=1 时经 go.Figure 校验一遍图表 dict。"""
+    if not _VALIDATE_FIGS:
+        return fig_dict
+    import plotly.graph_objects as go
+    return fig_to_json_safe(go.Figure(fig_dict))
 
-    dim_means = df_dims[CATEGORY_ORDER].mean() if all(c in df_dims.columns for c in CATEGORY_ORDER) else df_dims.mean()
-    summary = pd.DataFrame({"维度": dim_means.index, "全员平均分": dim_means.values.round(2)})
-    behavior_avgs = get_behavior_avg_by_dimension(df_q, col_to_cat_be)
-    row_index = df_q.index[0]
-    labels, person_vals = get_person_behavior_scores(df_q, col_to_cat_be, row_index)
-    _, all_vals = get_all_behavior_avgs(df_q, col_to_cat_be)
-    dim_cols = [c for c in CATEGORY_ORDER if c in df_dims.columns]
-    total_person = total.loc[row_index]
 
-    parts = []
-    parts.append("""<!DOCTYPE html>
+# 各类图表的固定布局模板：循环内只做 dict 合并补上标题/高度等差异项
+_SUMMARY_LAYOUT_TPL = {
+    "title": {"text": "五维度全员平均分"},
+    "xaxis": {"title": {"text": "平均分"}},
+    "yaxis": {"title": {"text": ""}},
+    "height": 380,
+    "margin": {"l": 120},
+}
+_DIM_LAYOUT_TPL = {
+    "xaxis": {"title": {"text": "平均分"}, "range": [0, 5.5]},
+    "margin": {"l": 140},
+    "showlegend": False,
+}
+_PERSON_LAYOUT_TPL = {
+    "xaxis": {"title": {"text": "行为项"}, "tickangle": -45},
+    "yaxis": {"title": {"text": "得分"}, "range": [0.5, 5.5]},
+    "height": 500,
+    "legend": {"orientation": "h", "y": 1.02},
+    "margin": {"b": 140},
+}
+
+
+# 页面头模板常量：模块加载时解析一次；动态的 script src 与数据统计行单独写入，
+# CSS 里的花括号和百分号都不再需要转义
+_HEADER_HEAD = """<!DOCTYPE html>
 <html lang="zh-CN">
 <head>
   <meta charset="UTF-8" />
   <title>管理者调研报告 - 示例输出</title>
-  <script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
-  <style>
+"""
+_HEADER_STYLE_BODY = """  <style>
     body { font-family: "PingFang SC", "Microsoft YaHei", sans-serif; max-width: 1000px; margin: 0 auto; padding: 24px; }
     h1 { border-bottom: 2px solid #3498DB; padding-bottom: 8px; }
     h2 { color: #2C3E50; margin-top: 32px; }
     h3 { color: #34495E; margin-top: 24px; }
-    table { border-collapse: collapse; width: 100%%; margin: 16px 0; }
+    table { border-collapse: collapse; width: 100%; margin: 16px 0; }
     th, td { border: 1px solid #ddd; padding: 10px 12px; text-align: left; }
     th { background: #3498DB; color: #fff; }
     .chart { margin: 24px 0; }
@@ -68,50 +135,130 @@ def main():
 </head>
 <body>
   <h1>管理者调研报告自动生成工具 · 示例输出</h1>
-  <p>数据来源：原始底表.xlsx，共 %d 条记录，%d 道题。</p>
-""" % (len(df), len(col_to_cat_be)))
-
-    # 一、摘要报告
-    parts.append('<div class="section"><h2>一、摘要报告：五维度全员平均分</h2>')
-    parts.append('<table><tr><th>维度</th><th>全员平均分</th></tr>')
-    for _, r in summary.iterrows():
-        parts.append("<tr><td>%s</td><td>%.2f</td></tr>" % (r["维度"], r["全员平均分"]))
-    parts.append("</table>")
-    fig0 = go.Figure(data=[go.Bar(x=summary["全员平均分"].tolist(), y=summary["维度"].tolist(), orientation="h", marker_color=COLORS_BARS[0])])
-    fig0.update_layout(title="五维度全员平均分", xaxis_title="平均分", yaxis_title="", height=380, margin=dict(l=120))
-    fd0 = fig_to_json_safe(fig0)
-    parts.append('<div class="chart" id="chart_summary"></div><script>Plotly.newPlot("chart_summary", %s, %s, {responsive: true});</script></div>' % (json.dumps(fd0["data"]), json.dumps(fd0["layout"])))
-
-    # 二、模块报告
-    parts.append('<div class="section"><h2>二、模块报告：各维度行为项得分（全员平均）</h2>')
-    for i, cat in enumerate(CATEGORY_ORDER):
-        if cat not in behavior_avgs:
-            continue
-        be_dict = behavior_avgs[cat]
-        be_names = list(be_dict.keys())
-        be_scores = [round(be_dict[b], 2) for b in be_names]
-        color = COLORS_BARS[i % len(COLORS_BARS)]
-        fig = go.Figure(data=[go.Bar(x=be_scores, y=be_names, orientation="h", marker_color=color)])
-        fig.update_layout(title=cat, xaxis_title="平均分", xaxis=dict(range=[0, 5.5]), height=max(260, len(be_names) * 40), margin=dict(l=140), showlegend=False)
-        fd = fig_to_json_safe(fig)
-        parts.append('<h3>%s</h3><div class="chart" id="chart_dim_%d"></div><script>Plotly.newPlot("chart_dim_%d", %s, %s, {responsive: true});</script>' % (cat, i, i, json.dumps(fd["data"]), json.dumps(fd["layout"])))
-    parts.append("</div>")
-
-    # 三、学员详细报告
-    parts.append('<div class="section"><h2>三、学员详细报告（示例：%s）</h2>' % names[0])
-    fig_p = go.Figure()
-    fig_p.add_trace(go.Scatter(x=labels, y=[float(v) for v in person_vals], mode="lines+markers", name="该学员得分", line=dict(color="#E74C3C", width=2), marker=dict(size=8)))
-    fig_p.add_trace(go.Scatter(x=labels, y=[float(v) for v in all_vals], mode="lines+markers", name="全员平均分", line=dict(color="#3498DB", width=2, dash="dash"), marker=dict(size=8)))
-    fig_p.update_layout(title="%s 各行为项得分 vs 全员平均" % names[0], xaxis_title="行为项", yaxis_title="得分", yaxis=dict(range=[0.5, 5.5]), height=500, legend=dict(orientation="h", y=1.02), margin=dict(b=140), xaxis_tickangle=-45)
-    fpd = fig_to_json_safe(fig_p)
-    parts.append('<div class="chart" id="chart_person"></div><script>Plotly.newPlot("chart_person", %s, %s, {responsive: true});</script>' % (json.dumps(fpd["data"]), json.dumps(fpd["layout"])))
-    parts.append("<p><strong>总分（全部题目平均）：</strong> %.2f</p>" % float(total_person))
-    parts.append("<p><strong>各维度平均分：</strong> " + "；".join("%s %.2f" % (c, float(df_dims.loc[row_index, c])) for c in dim_cols) + "</p>")
-    parts.append("</div></body></html>")
+"""
+
+
+def _write_chart(buf, chart_id, data_json, layout_json):
+    """分段写入图表挂载点与 newPlot 调用，几 MB 的 JSON 串不再经 % 拼接复制。"""
+    buf.write(f'<div class="chart" id="{chart_id}"></div><script>Plotly.newPlot("{chart_id}", ')
+    buf.write(data_json)
+    buf.write(", ")
+    buf.write(layout_json)
+    buf.write(", {responsive: true});</script>")
+
+
+def _encode_dim_fig(args):
+    """单个维度条形图：构图 + JSON 编码，供线程池并行调用。"""
+    i, cat, be_names, be_scores, color = args
+    fd = _maybe_validate({
+        "data": [{"type": "bar", "x": _typed(be_scores), "y": be_names, "orientation": "h", "marker": {"color": color}}],
+        "layout": {**_DIM_LAYOUT_TPL, "title": {"text": cat}, "height": max(260, len(be_names) * 40)},
+    })
+    return i, cat, _dumps(fd["data"]), _dumps(fd["layout"])
 
+
+def main():
+    base = os.path.dirname(os.path.abspath(__file__))
+    path = os.path.join(base, "原始底表.xlsx")
+    if not os.path.isfile(path):
+        print("未找到 原始底表.xlsx")
+        return
+    # 解析+计算结果按源文件 mtime/size 缓存到 cache/，反复调试 HTML 模板时免去重复读 Excel
+    cache_key = hashlib.md5(("%s:%s" % (os.path.getmtime(path), os.path.getsize(path))).encode()).hexdigest()
+    cache_file = os.path.join(base, "cache", "report_demo_%s.pkl" % cache_key)
+    if os.path.isfile(cache_file):
+        with open(cache_file, "rb") as f:
+            df, df_q, col_to_cat_be, df_dims, behavior_avgs, total = pickle.load(f)
+    else:
+        # read_only 流式读取，不构建整棵 openpyxl 单元格对象树，大表可快一个数量级
+        df = pd.read_excel(path, sheet_name=0, engine="openpyxl", engine_kwargs={"read_only": True, "data_only": True})
+        df_q, col_to_cat_be, _ = clean_and_score(df)
+        if df_q is None:
+            print("数据解析失败")
+            return
+        df_dims = compute_dimension_scores(df_q, col_to_cat_be)
+        total, _ = get_person_total_and_dims(df_q, df_dims)
+        behavior_avgs = get_behavior_avg_by_dimension(df_q, col_to_cat_be)
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump((df, df_q, col_to_cat_be, df_dims, behavior_avgs, total), f, pickle.HIGHEST_PROTOCOL)
+    name_col = "填写人" if "填写人" in df.columns else None
+    # 下游只用到第一位学员的姓名，单取一格即可，不整列转字符串
+    first_name = str(df[name_col].iat[0]) if (name_col and len(df)) else "学员1"
+
+    dim_set = set(df_dims.columns)
+    dim_means = df_dims[CATEGORY_ORDER].mean() if all(c in dim_set for c in CATEGORY_ORDER) else df_dims.mean()
+    dim_names = dim_means.index.tolist()
+    dim_vals = np.round(dim_means.to_numpy(), 2).tolist()
+    # 第一行按位置取：total/df_dims 走 .iloc 免去索引哈希表查找，
+    # 行标签只在需要标签语义的 get_person_behavior_scores 里用
+    row_pos = 0
+    row_label = df_q.index[row_pos]
+    labels, person_vals = get_person_behavior_scores(df_q, col_to_cat_be, row_label)
+    _, all_vals = get_all_behavior_avgs(df_q, col_to_cat_be)
+    dim_cols = [c for c in CATEGORY_ORDER if c in dim_set]
+    total_person = float(total.iloc[row_pos])
+
+    # 只用到 bar/scatter 两种 trace，basic 包（约 1MB）即可，比完整包小约 3 倍；
+    # 若 assets/ 下已放置本地副本则直接引用，离线环境也能打开
+    plotly_src = "https://cdn.plot.ly/plotly-basic-3.0.1.min.js"
+    if os.path.isfile(os.path.join(base, "assets", "plotly-basic.min.js")):
+        plotly_src = "assets/plotly-basic.min.js"
+
+    # 边生成边写盘：整份 HTML 不再驻留内存，JSON 编码与磁盘回写重叠
     out_path = os.path.join(base, "报告示例_原始底表.html")
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(parts))
+    with open(out_path, "w", encoding="utf-8", buffering=1 << 20) as buf:
+        buf.write(_HEADER_HEAD)
+        buf.write(f'  <script src="{plotly_src}"></script>\n')
+        buf.write(_HEADER_STYLE_BODY)
+        buf.write(f"  <p>数据来源：原始底表.xlsx，共 {len(df)} 条记录，{len(col_to_cat_be)} 道题。</p>\n")
+
+        # 一、摘要报告
+        buf.write('<div class="section"><h2>一、摘要报告：五维度全员平均分</h2>')
+        buf.write('<table><tr><th>维度</th><th>全员平均分</th></tr>')
+        # 行内容一次 join 后单次写出，省掉逐行 write 调用
+        buf.write("".join(f"<tr><td>{n}</td><td>{v:.2f}</td></tr>" for n, v in zip(dim_names, dim_vals)))
+        buf.write("</table>")
+        fd0 = _maybe_validate({
+            "data": [{"type": "bar", "x": _typed(dim_vals), "y": dim_names, "orientation": "h", "marker": {"color": COLORS_BARS[0]}}],
+            "layout": _SUMMARY_LAYOUT_TPL,
+        })
+        _write_chart(buf, "chart_summary", _dumps(fd0["data"]), _dumps(fd0["layout"]))
+        buf.write("</div>")
+
+        # 二、模块报告：5 个维度的构图/编码互相独立，线程池并行后按原顺序写出
+        buf.write('<div class="section"><h2>二、模块报告：各维度行为项得分（全员平均）</h2>')
+        jobs = []
+        for i, cat in enumerate(CATEGORY_ORDER):
+            if cat not in behavior_avgs:
+                continue
+            be_dict = behavior_avgs[cat]
+            be_names = list(be_dict.keys())
+            be_scores = [round(be_dict[b], 2) for b in be_names]
+            jobs.append((i, cat, be_names, be_scores, COLORS_BARS[i % len(COLORS_BARS)]))
+        if jobs:
+            with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as ex:
+                results = list(ex.map(_encode_dim_fig, jobs))
+            for i, cat, data_json, layout_json in results:
+                buf.write(f"<h3>{cat}</h3>")
+                _write_chart(buf, f"chart_dim_{i}", data_json, layout_json)
+        buf.write("</div>")
+
+        # 三、学员详细报告
+        buf.write(f'<div class="section"><h2>三、学员详细报告（示例：{first_name}）</h2>')
+        fpd = _maybe_validate({
+            "data": [
+                {"type": "scatter", "x": labels, "y": _typed(person_vals), "mode": "lines+markers", "name": "该学员得分", "line": {"color": "#E74C3C", "width": 2}, "marker": {"size": 8}},
+                {"type": "scatter", "x": labels, "y": _typed(all_vals), "mode": "lines+markers", "name": "全员平均分", "line": {"color": "#3498DB", "width": 2, "dash": "dash"}, "marker": {"size": 8}},
+            ],
+            "layout": {**_PERSON_LAYOUT_TPL, "title": {"text": f"{first_name} 各行为项得分 vs 全员平均"}},
+        })
+        _write_chart(buf, "chart_person", _dumps(fpd["data"]), _dumps(fpd["layout"]))
+        buf.write(f"<p><strong>总分（全部题目平均）：</strong> {total_person:.2f}</p>")
+        # 一次切片取整行，免去每个维度各走一趟标签查找
+        row_vals = df_dims[dim_cols].iloc[row_pos].to_numpy(dtype=float)
+        buf.write("<p><strong>各维度平均分：</strong> " + "；".join("%s %.2f" % (c, v) for c, v in zip(dim_cols, row_vals)) + "</p>")
+        buf.write("</div></body></html>")
     print("已生成报告示例：", out_path)
 
 
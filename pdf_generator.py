@@ -6,28 +6,174 @@
 
 import io
 import os
+from copy import copy
 from datetime import datetime
+from functools import lru_cache
 from xml.sax.saxutils import escape
 
-REPORTLAB_IMPORT_ERROR = None
-try:
-    from reportlab.lib import colors
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import cm
-    from reportlab.platypus import (
-        SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, PageBreak, KeepTogether,
+import importlib.util
+
+import pandas as pd
+
+# reportlab 体量不小（数十个子模块、字体与图像机器），纯分析路径用不到；
+# 模块加载时只做轻量的安装探测，真正生成 PDF 时才导入并构建共享样式
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+REPORTLAB_IMPORT_ERROR = None if REPORTLAB_AVAILABLE else "No module named 'reportlab'"
+
+# 摘要页左右边距与 SimpleDocTemplate 一致，用于表格总宽=可用宽度，保证与段落左对齐
+_FRAME_WIDTH_CM = 21 - 2 - 2  # A4 21cm，左右边距各 2cm
+
+_REPORTLAB_READY = False
+
+
+def _ensure_reportlab():
+    """首次需要时导入 reportlab 并初始化共享样式；失败则更新可用性标记并返回 False。"""
+    global _REPORTLAB_READY, REPORTLAB_AVAILABLE, REPORTLAB_IMPORT_ERROR
+    if _REPORTLAB_READY:
+        return True
+    if not REPORTLAB_AVAILABLE:
+        return False
+    try:
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import cm
+        from reportlab.platypus import (
+            SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, PageBreak,
+        )
+        from reportlab.platypus import Flowable
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+        from reportlab.lib.utils import ImageReader
+        from reportlab import rl_config
+        from reportlab.lib.enums import TA_LEFT, TA_CENTER
+    except ImportError as e:
+        REPORTLAB_AVAILABLE = False
+        REPORTLAB_IMPORT_ERROR = str(e)
+        return False
+
+    g = globals()
+    g.update(
+        colors=colors, A4=A4, getSampleStyleSheet=getSampleStyleSheet,
+        ParagraphStyle=ParagraphStyle, cm=cm, SimpleDocTemplate=SimpleDocTemplate,
+        Paragraph=Paragraph, Spacer=Spacer, Table=Table, TableStyle=TableStyle,
+        Image=Image, PageBreak=PageBreak, pdfmetrics=pdfmetrics, TTFont=TTFont,
+        ImageReader=ImageReader, rl_config=rl_config, TA_LEFT=TA_LEFT, TA_CENTER=TA_CENTER,
     )
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
-    from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
-    REPORTLAB_AVAILABLE = True
-    REPORTLAB_IMPORT_ERROR = None
-    # 摘要页左右边距与 SimpleDocTemplate 一致，用于表格总宽=可用宽度，保证与段落左对齐
-    _FRAME_WIDTH_CM = 21 - 2 - 2  # A4 21cm，左右边距各 2cm
-except ImportError as e:
-    REPORTLAB_AVAILABLE = False
-    REPORTLAB_IMPORT_ERROR = str(e)
+
+    # HexColor 每次调用都重新解析字符串并分配 Color 对象；配色就那几种，缓存复用
+    g["_hex_color"] = _hex_color = lru_cache(maxsize=128)(colors.HexColor)
+
+    # 底图按路径缓存 ImageReader：反复实例化 PDFReport 时共享同一份解码位图
+    g["_bg_reader_for_path"] = lru_cache(maxsize=4)(ImageReader)
+
+    # 反复使用的表格样式只构建一次：TableStyle 初始化会逐条解析校验命令
+    g["_STYLE_TIP_BOX"] = TableStyle([
+        ("BACKGROUND", (0, 0), (-1, -1), _hex_color("#fffacd")),
+        ("LEFTPADDING", (0, 0), (-1, -1), 8),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 8),
+        ("TOPPADDING", (0, 0), (-1, -1), 6),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+    ])
+    # 摘要页「左文右图」两栏行（row1/row2 共用；row1 另补右栏 8pt 左距）
+    g["_STYLE_MEDIA_ROW"] = TableStyle([
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("ALIGN", (0, 0), (0, 0), "LEFT"),
+        ("ALIGN", (1, 0), (1, 0), "CENTER"),
+        ("LEFTPADDING", (0, 0), (0, -1), 0),
+        ("RIGHTPADDING", (0, 0), (0, -1), 0),
+        ("TOPPADDING", (0, 0), (-1, -1), 0),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
+    ])
+    g["_STYLE_MEDIA_ROW_GAP"] = TableStyle([
+        ("LEFTPADDING", (1, 0), (1, 0), 8),
+    ])
+    g["_STYLE_LEFT_BLOCK"] = TableStyle([
+        ("LEFTPADDING", (0, 0), (-1, -1), 0),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+        ("TOPPADDING", (0, 0), (-1, -1), 0),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
+        ("TOPPADDING", (0, 1), (0, 1), 4),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+    ])
+    g["_STYLE_PIE_TWO"] = TableStyle([
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("LEFTPADDING", (0, 0), (0, -1), 0),
+        ("LEFTPADDING", (1, 0), (1, -1), 0),
+    ])
+    g["_STYLE_ANOM_ALIGN"] = TableStyle([
+        ("ALIGN", (2, 1), (2, -1), "CENTER"),
+    ])
+    g["_ANOM_COL_WIDTHS"] = (3 * cm, 3 * cm, 2.5 * cm, 6 * cm)
+    g["_STYLE_ANOM_ALIGN_MERGED"] = TableStyle([
+        ("ALIGN", (2, 1), (3, -1), "CENTER"),
+    ])
+    g["_ANOM_COL_WIDTHS_MERGED"] = (5 * cm, 2.5 * cm, 2 * cm, 1.5 * cm, 6 * cm)
+    g["_STYLE_CARDS_ROW"] = TableStyle([
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("LEFTPADDING", (0, 0), (-1, -1), 0),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+    ])
+
+    @lru_cache(maxsize=8)
+    def _grid_style(font_name, header_bg, valign=None):
+        """带表头底色的简单网格表样式（行为项均分表、异常提醒表共用）。"""
+        cmds = [
+            ("FONTNAME", (0, 0), (-1, -1), font_name or "Helvetica"),
+            ("FONTSIZE", (0, 0), (-1, -1), 9),
+            ("BACKGROUND", (0, 0), (-1, 0), _hex_color(header_bg)),
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+        ]
+        if valign:
+            cmds.append(("VALIGN", (0, 0), (-1, -1), valign))
+        return TableStyle(cmds)
+
+    g["_grid_style"] = _grid_style
+
+    class _FlatRowsFlowable(Flowable):
+        """行高固定的只读列表直绘：逐行 drawString，完全绕开 Paragraph/Table
+        的解析与列宽机器。仅在行数极多、网格表成本不可接受时使用；
+        split 按整行切分以支持跨页。"""
+
+        _ROW_H = 13
+        _FONT_SIZE = 9
+
+        def __init__(self, rows, font_name, col_xs):
+            Flowable.__init__(self)
+            self.rows = rows
+            self.font_name = font_name or "Helvetica"
+            self.col_xs = col_xs
+
+        def wrap(self, availWidth, availHeight):
+            self.width = availWidth
+            self.height = len(self.rows) * self._ROW_H
+            return self.width, self.height
+
+        def split(self, availWidth, availHeight):
+            n = int(availHeight // self._ROW_H)
+            if n <= 0 or n >= len(self.rows):
+                return []
+            return [
+                _FlatRowsFlowable(self.rows[:n], self.font_name, self.col_xs),
+                _FlatRowsFlowable(self.rows[n:], self.font_name, self.col_xs),
+            ]
+
+        def draw(self):
+            c = self.canv
+            c.setFont(self.font_name, self._FONT_SIZE)
+            y = self.height - self._ROW_H + 3
+            for cells in self.rows:
+                for x, s in zip(self.col_xs, cells):
+                    c.drawString(x, y, s)
+                y -= self._ROW_H
+
+    g["_FlatRowsFlowable"] = _FlatRowsFlowable
+    _REPORTLAB_READY = True
+    return True
+
 
 try:
     from app_config import COLOR_SCHEME, SURVEY_QUESTIONS, SCORE_MAP
@@ -60,11 +206,32 @@ SCORE_RULES_DATA = [
 ]
 
 
+# 题本固定不变，转义一次缓存于模块级，build 循环里不再逐行做字符串替换
+_SURVEY_ESCAPED = [(mod, be, escape(desc)) for mod, be, desc in SURVEY_QUESTIONS]
+
+# 动态字段转义：saxutils.escape 内部是三次 Python 级 str.replace，
+# 译表让整串在一次 C 级扫描里完成；只用于段落正文，不涉及属性，无需转义引号
+_ESC_TBL = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+@lru_cache(maxsize=1024)
+def _esc(s):
+    """转义缓存：姓名/部门/维度名在多行间高度重复，转义一次即可。"""
+    return s.translate(_ESC_TBL)
+
+
+@lru_cache(maxsize=4)
 def _register_chinese_font(app_dir: str = None):
-    """注册中文字体，优先 TTF。返回注册后的字体名称，失败返回 None（调用方用 Helvetica 回退）。"""
+    """注册中文字体，优先 TTF。返回注册后的字体名称，失败返回 None（调用方用 Helvetica 回退）。
+
+    按 app_dir 缓存：字体注册在 pdfmetrics 里是进程级的，重复 build 不必再扫一遍
+    候选路径、更不必重新解析 TTF。
+    """
     if not REPORTLAB_AVAILABLE:
         return None
     font_name = "ChineseFont"
+    if font_name in pdfmetrics.getRegisteredFontNames():
+        return font_name
     candidates = []
     if app_dir:
         for name in ("NotoSansSC-Regular.ttf", "font.ttf", "NotoSansSC-Regular.otf"):
@@ -89,6 +256,12 @@ def _register_chinese_font(app_dir: str = None):
             continue
         try:
             pdfmetrics.registerFont(TTFont(font_name, path))
+            # 预热度量：首次 stringWidth 会懒构建字宽表，提前做掉，
+            # 首页排版不再为此买单
+            try:
+                pdfmetrics.stringWidth("管理者报告", font_name, 10)
+            except Exception:
+                pass
             return font_name
         except Exception:
             continue
@@ -105,23 +278,190 @@ def _mean_score_to_label(mean_score):
     return SCORE_TO_LABEL.get(int(s), "—")
 
 
+@lru_cache(maxsize=128)
 def _lighten_hex(hex_color: str, blend_white: float = 0.75):
     """将十六进制颜色与白色混合，得到更浅的底色，便于深色文字阅读。"""
-    if not hex_color or not hex_color.startswith("#"):
+    if not hex_color or not hex_color.startswith("#") or len(hex_color) != 7:
         return "#f8f8f8"
-    hex_color = hex_color.strip("#")
-    if len(hex_color) != 6:
+    # 颜色来自固定的 COLOR_SCHEME，一次 int 解析 + 位运算混白即可，不必逐通道切片
+    try:
+        packed = int(hex_color[1:], 16)
+    except ValueError:
         return "#f8f8f8"
+    scale = round(blend_white * 256)  # 0.75 -> 192，整数混合：c + ((255-c)*scale >> 8)
+    r = (packed >> 16) & 0xFF
+    g = (packed >> 8) & 0xFF
+    b = packed & 0xFF
+    r += (255 - r) * scale >> 8
+    g += (255 - g) * scale >> 8
+    b += (255 - b) * scale >> 8
+    return "#%02x%02x%02x" % (r, g, b)
+
+
+@lru_cache(maxsize=64)
+def _cached_para(text, style_name, font_name):
+    return Paragraph(text, _get_styles(font_name)[style_name])
+
+
+def _header_para(text, style_name, font_name):
+    """表头等字面量段落：mini-XML 只解析一次，取浅拷贝避免跨排版复用内部状态。"""
+    return copy(_cached_para(text, style_name, font_name))
+
+
+@lru_cache(maxsize=4096)
+def _row_para_cached(text, style_name, font_name):
+    return Paragraph(text, _get_styles(font_name)[style_name])
+
+
+def _row_para(text, style_name, font_name):
+    """数据行段落：部门/说明/空分值在大量行间高度重复，按 (文本, 样式) 记忆化
+    mini-XML 解析，取浅拷贝隔离各单元格的排版状态。build 结束后清空，避免跨报告积累。"""
+    return copy(_row_para_cached(text, style_name, font_name))
+
+
+def _fit_cell(text, col_width, font_name, style_name="table_cell"):
+    """纯字符串单元格不折行：按 9pt 量宽（扣除左右默认内边距各 6pt），
+    列宽放得下才走纯文本快路径，放不下回退 Paragraph 以获得折行。"""
     try:
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        r = int(r + (255 - r) * blend_white)
-        g = int(g + (255 - g) * blend_white)
-        b = int(b + (255 - b) * blend_white)
-        return "#%02x%02x%02x" % (r, g, b)
+        if pdfmetrics.stringWidth(text, font_name or "Helvetica", 9) <= col_width - 12:
+            return text
     except Exception:
-        return "#f8f8f8"
+        pass
+    return _row_para(_esc(text), style_name, font_name)
+
+
+@lru_cache(maxsize=8)
+def _get_styles(font_name):
+    """构建并缓存段落样式表。样式只取决于字体名，跨报告复用，勿在取出后修改。"""
+    base = getSampleStyleSheet()
+    font = font_name or "Helvetica"
+    return {
+        "title": ParagraphStyle(
+            name="CustomTitle",
+            parent=base["Title"],
+            fontName=font,
+            fontSize=18,
+            spaceAfter=12,
+            alignment=TA_CENTER,
+        ),
+        "heading1": ParagraphStyle(
+            name="H1",
+            parent=base["Heading1"],
+            fontName=font,
+            fontSize=14,
+            spaceBefore=14,
+            spaceAfter=8,
+            alignment=TA_LEFT,
+            leftIndent=0,
+            firstLineIndent=0,
+        ),
+        "heading2": ParagraphStyle(
+            name="H2",
+            parent=base["Heading2"],
+            fontName=font,
+            fontSize=12,
+            spaceBefore=10,
+            spaceAfter=6,
+            alignment=TA_LEFT,
+            leftIndent=0,
+            firstLineIndent=0,
+        ),
+        "body": ParagraphStyle(
+            name="Body",
+            parent=base["Normal"],
+            fontName=font,
+            fontSize=10,
+            leading=14,
+            spaceAfter=6,
+            alignment=TA_LEFT,
+            leftIndent=0,
+            firstLineIndent=0,
+        ),
+        "subtitle": ParagraphStyle(
+            name="Subtitle",
+            parent=base["Normal"],
+            fontName=font,
+            fontSize=14,
+            spaceAfter=12,
+            alignment=TA_CENTER,
+        ),
+        "table_cell": ParagraphStyle(
+            name="TableCell",
+            parent=base["Normal"],
+            fontName=font,
+            fontSize=9,
+            leading=11,
+            spaceAfter=0,
+            spaceBefore=0,
+            leftIndent=0,
+            rightIndent=0,
+            alignment=TA_LEFT,
+        ),
+        "table_cell_center": ParagraphStyle(
+            name="TableCellCenter",
+            parent=base["Normal"],
+            fontName=font,
+            fontSize=9,
+            leading=11,
+            spaceAfter=0,
+            spaceBefore=0,
+            alignment=TA_CENTER,
+        ),
+        "table_cell_tight": ParagraphStyle(
+            name="TableCellTight",
+            parent=base["Normal"],
+            fontName=font,
+            fontSize=8,
+            leading=9,
+            spaceAfter=0,
+            spaceBefore=0,
+            leftIndent=0,
+            rightIndent=0,
+            alignment=TA_LEFT,
+        ),
+        "table_cell_center_tight": ParagraphStyle(
+            name="TableCellCenterTight",
+            parent=base["Normal"],
+            fontName=font,
+            fontSize=8,
+            leading=9,
+            spaceAfter=0,
+            spaceBefore=0,
+            alignment=TA_CENTER,
+        ),
+        "table_cell_survey": ParagraphStyle(
+            name="TableCellSurvey",
+            parent=base["Normal"],
+            fontName=font,
+            fontSize=10,
+            leading=12,
+            spaceAfter=0,
+            spaceBefore=0,
+            leftIndent=0,
+            rightIndent=0,
+            alignment=TA_LEFT,
+        ),
+        "table_cell_center_survey": ParagraphStyle(
+            name="TableCellCenterSurvey",
+            parent=base["Normal"],
+            fontName=font,
+            fontSize=10,
+            leading=12,
+            spaceAfter=0,
+            spaceBefore=0,
+            alignment=TA_CENTER,
+        ),
+        "note_red": ParagraphStyle(
+            name="NoteRed",
+            parent=base["Normal"],
+            fontName=font,
+            fontSize=9,
+            leading=11,
+            spaceAfter=4,
+            spaceBefore=0,
+            textColor=_hex_color("#c00000"),
+        ),
+    }
 
 
 class PDFReport:
@@ -132,143 +472,30 @@ class PDFReport:
         app_dir: 应用根目录，用于查找 fonts/ 下中文字体。
         report_type: "team" | "personal"
         """
+        _ensure_reportlab()
         self.app_dir = app_dir
         self.report_type = report_type
         self.buffer = io.BytesIO()
         self.font_name = _register_chinese_font(app_dir)
         self.styles = None
         self.doc = None
-
-    def _build_styles(self):
-        base = getSampleStyleSheet()
-        self.styles = {
-            "title": ParagraphStyle(
-                name="CustomTitle",
-                parent=base["Title"],
-                fontName=self.font_name or "Helvetica",
-                fontSize=18,
-                spaceAfter=12,
-                alignment=TA_CENTER,
-            ),
-            "heading1": ParagraphStyle(
-                name="H1",
-                parent=base["Heading1"],
-                fontName=self.font_name or "Helvetica",
-                fontSize=14,
-                spaceBefore=14,
-                spaceAfter=8,
-                alignment=TA_LEFT,
-                leftIndent=0,
-                firstLineIndent=0,
-            ),
-            "heading2": ParagraphStyle(
-                name="H2",
-                parent=base["Heading2"],
-                fontName=self.font_name or "Helvetica",
-                fontSize=12,
-                spaceBefore=10,
-                spaceAfter=6,
-                alignment=TA_LEFT,
-                leftIndent=0,
-                firstLineIndent=0,
-            ),
-            "body": ParagraphStyle(
-                name="Body",
-                parent=base["Normal"],
-                fontName=self.font_name or "Helvetica",
-                fontSize=10,
-                leading=14,
-                spaceAfter=6,
-                alignment=TA_LEFT,
-                leftIndent=0,
-                firstLineIndent=0,
-            ),
-            "subtitle": ParagraphStyle(
-                name="Subtitle",
-                parent=base["Normal"],
-                fontName=self.font_name or "Helvetica",
-                fontSize=14,
-                spaceAfter=12,
-                alignment=TA_CENTER,
-            ),
-            "table_cell": ParagraphStyle(
-                name="TableCell",
-                parent=base["Normal"],
-                fontName=self.font_name or "Helvetica",
-                fontSize=9,
-                leading=11,
-                spaceAfter=0,
-                spaceBefore=0,
-                leftIndent=0,
-                rightIndent=0,
-                alignment=TA_LEFT,
-            ),
-            "table_cell_center": ParagraphStyle(
-                name="TableCellCenter",
-                parent=base["Normal"],
-                fontName=self.font_name or "Helvetica",
-                fontSize=9,
-                leading=11,
-                spaceAfter=0,
-                spaceBefore=0,
-                alignment=TA_CENTER,
-            ),
-            "table_cell_tight": ParagraphStyle(
-                name="TableCellTight",
-                parent=base["Normal"],
-                fontName=self.font_name or "Helvetica",
-                fontSize=8,
-                leading=9,
-                spaceAfter=0,
-                spaceBefore=0,
-                leftIndent=0,
-                rightIndent=0,
-                alignment=TA_LEFT,
-            ),
-            "table_cell_center_tight": ParagraphStyle(
-                name="TableCellCenterTight",
-                parent=base["Normal"],
-                fontName=self.font_name or "Helvetica",
-                fontSize=8,
-                leading=9,
-                spaceAfter=0,
-                spaceBefore=0,
-                alignment=TA_CENTER,
-            ),
-            "table_cell_survey": ParagraphStyle(
-                name="TableCellSurvey",
-                parent=base["Normal"],
-                fontName=self.font_name or "Helvetica",
-                fontSize=10,
-                leading=12,
-                spaceAfter=0,
-                spaceBefore=0,
-                leftIndent=0,
-                rightIndent=0,
-                alignment=TA_LEFT,
-            ),
-            "table_cell_center_survey": ParagraphStyle(
-                name="TableCellCenterSurvey",
-                parent=base["Normal"],
-                fontName=self.font_name or "Helvetica",
-                fontSize=10,
-                leading=12,
-                spaceAfter=0,
-                spaceBefore=0,
-                alignment=TA_CENTER,
-            ),
-            "note_red": ParagraphStyle(
-                name="NoteRed",
-                parent=base["Normal"],
-                fontName=self.font_name or "Helvetica",
-                fontSize=9,
-                leading=11,
-                spaceAfter=4,
-                spaceBefore=0,
-                textColor=colors.HexColor("#c00000"),
-            ),
-        }
-        return self.styles
+        # 底图只解析一次：ImageReader 缓存解码后的位图，逐页绘制不再重新读盘解码；
+        # 按路径在模块级缓存，跨 PDFReport 实例也共享同一份
+        self._background_path = self._resolve_background_path()
+        self._bg_reader = None
+        if REPORTLAB_AVAILABLE and self._background_path:
+            try:
+                self._bg_reader = _bg_reader_for_path(self._background_path)
+            except Exception:
+                self._bg_reader = None
+        # 页眉逐页重绘，但文案与坐标在一次构建内不变：日期只取一次，
+        # 坐标预先算好，_canvas_header 每页只剩两次 drawString
+        self._header_cmds = None
+        if REPORTLAB_AVAILABLE:
+            self._header_cmds = (
+                2 * cm, A4[0] - 2 * cm, A4[1] - 1.2 * cm,
+                HEADER_LEFT, _get_header_date(),
+            )
 
     def _resolve_background_path(self):
         """解析底图路径：优先 assets/background.png，其次 background.png。"""
@@ -282,8 +509,8 @@ class PDFReport:
 
     def _canvas_background(self, canvas, doc):
         """在页面最底层绘制镜像底图，并降低不透明度，避免角标压住正文。"""
-        path = getattr(self, "_background_path", None)
-        if not path or not os.path.isfile(path):
+        reader = self._bg_reader
+        if reader is None:
             return
         try:
             canvas.saveState()
@@ -296,17 +523,20 @@ class PDFReport:
                 # 横向镜像后装饰移到右上/左下，再配合低透明度，正文区域更干净。
                 canvas.translate(A4[0], 0)
                 canvas.scale(-1, 1)
-                canvas.drawImage(path, 0, 0, width=A4[0], height=A4[1], mask="auto")
+                canvas.drawImage(reader, 0, 0, width=A4[0], height=A4[1], mask="auto")
             finally:
                 canvas.restoreState()
         except Exception:
             pass
 
     def _canvas_header(self, canvas, doc):
+        if self._header_cmds is None:
+            return
+        x_left, x_right, y, left_text, date_text = self._header_cmds
         canvas.saveState()
         canvas.setFont("Helvetica", 9)
-        canvas.drawString(2 * cm, A4[1] - 1.2 * cm, HEADER_LEFT)
-        canvas.drawRightString(A4[0] - 2 * cm, A4[1] - 1.2 * cm, _get_header_date())
+        canvas.drawString(x_left, y, left_text)
+        canvas.drawRightString(x_right, y, date_text)
         canvas.restoreState()
 
     def build(
@@ -342,459 +572,515 @@ class PDFReport:
         team_size_votes: [(选项, 人数), ...] 团队规模分布，按人数降序；无则传 None 或 []
         person_details: [(姓名, 雷达图BytesIO, 折线图BytesIO, 维度得分卡), ...] 学员自陈结果细则，每人一行
         """
-        if not REPORTLAB_AVAILABLE:
+        if not _ensure_reportlab():
             raise RuntimeError("reportlab 未安装，请执行: pip install reportlab")
-        self._build_styles()
-        self.doc = SimpleDocTemplate(
-            self.buffer,
-            pagesize=A4,
-            rightMargin=2 * cm,
-            leftMargin=2 * cm,
-            topMargin=2.2 * cm,
-            bottomMargin=1.5 * cm,
-        )
-        story = []
-
-        # 第一页：封面 + 团队报告（居中）+ 第一部分（标红）+ 温馨提示（标黄）+ 第二部分 + 自评分数换算表
-        story.append(Paragraph("好未来新灵秀报告", self.styles["title"]))
-        story.append(Spacer(1, 0.5 * cm))
-        report_subtitle = "个人报告" if self.report_type == "personal" else "团队报告"
-        story.append(Paragraph(report_subtitle, self.styles["subtitle"]))
-        story.append(Spacer(1, 0.5 * cm))
-
-        # 第一部分（标红）
-        story.append(Paragraph('<font color="red">%s</font>' % PREFACE_RED_TITLE, self.styles["body"]))
-        story.append(Paragraph('<font color="red">%s</font>' % PREFACE_RED_LINE, self.styles["body"]))
-        story.append(Spacer(1, 0.2 * cm))
-        story.append(Paragraph(
-            "本报告旨在呈现新灵秀课程的学员在不同管理动作上的自我评估结果，我们在设计本期课程的重点强调内容时将进行参考。把调研结果同步给您是希望：",
-            self.styles["body"],
-        ))
-        story.append(Paragraph(
-            "1. 为您提供一个视角，即：学员们眼中的自己在团队中是否充分展现了各方面管理动作，以便您在帮助学员校准自我认知时能有的放矢",
-            self.styles["body"],
-        ))
-        story.append(Paragraph(
-            "2. 帮助学员打开乔哈里窗盲区，结合您对学员们的了解，帮助大家看见一些他们自己没有察觉的优劣势，未来期待着您的点拨和指导",
-            self.styles["body"],
-        ))
-        story.append(Paragraph(
-            "3. 请您知悉这些优秀的伙伴们踏上了成长为更优秀管理者的旅途，一路上期待有您的关注和陪伴",
-            self.styles["body"],
-        ))
-        story.append(Spacer(1, 0.2 * cm))
-        # 温馨提示（单独模块标黄）
-        tip_para = Paragraph(PREFACE_TIP, self.styles["body"])
-        tip_table = Table([[tip_para]], colWidths=[14 * cm])
-        tip_table.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#fffacd")),
-            ("LEFTPADDING", (0, 0), (-1, -1), 8),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 8),
-            ("TOPPADDING", (0, 0), (-1, -1), 6),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-        ]))
-        story.append(tip_table)
-        story.append(Spacer(1, 0.4 * cm))
-
-        # 第二部分：调研题本设计说明
-        story.append(Paragraph("第二部分  调研题本设计说明", self.styles["heading2"]))
-        story.append(Paragraph(
-            "本次调研在凯洛格（KeyLogic Group）金牌培养项目&lt;新经理成长地图&gt;的设计逻辑之上，融合好未来的集团特色，分别从管理角色认知、辅导、任务分配、激励和沟通 5 个维度对新任管理者的管理动作呈现情况进行调研。",
-            self.styles["body"],
-        ))
-        story.append(Paragraph("赋分标准", self.styles["heading2"]))
-        story.append(Paragraph(
-            "每个行为项的评分范围为 1～5 分，分数越高则表示参调者们出现该类行为的频率越高，报告中【均分】代表多位参调者自我描述的平均。自评分数换算逻辑：",
-            self.styles["body"],
-        ))
-        score_table = Table(SCORE_RULES_DATA, colWidths=[4 * cm, 8 * cm])
-        score_table.setStyle(TableStyle([
-            ("FONTNAME", (0, 0), (-1, -1), self.font_name or "Helvetica"),
-            ("FONTSIZE", (0, 0), (-1, -1), 10),
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#f0f0f0")),
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-            ("ALIGN", (0, 0), (0, -1), "CENTER"),
-            ("ALIGN", (1, 0), (1, -1), "LEFT"),
-        ]))
-        story.append(score_table)
-        story.append(PageBreak())
-
-        # 第二页：调研题目设置（整表铺满一页、不跨页；按可用高度均分行高，消除底部空白）
-        if SURVEY_QUESTIONS:
-            ps_cell = self.styles["table_cell_survey"]
-            ps_center = self.styles["table_cell_center_survey"]
-            q_data = [[
-                Paragraph("模块", ps_center),
-                Paragraph("行为项", ps_center),
-                Paragraph("具体行为描述", ps_center),
-            ]]
-            row_modules = []
-            for mod, be, desc in SURVEY_QUESTIONS:
-                row_modules.append(mod)
-                desc_safe = desc.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-                q_data.append([
-                    Paragraph(mod, ps_center),
-                    Paragraph(be, ps_center),
-                    Paragraph(desc_safe, ps_cell),
-                ])
-            # 第二页可用高度：页高 - 上下边距 - 标题与间距，均分给表头+数据行；略留余量避免跨页
-            page_h_pt = A4[1]
-            top_pt, bottom_pt = 2.2 * cm, 1.5 * cm
-            heading_spacer_pt = 1.0 * cm + 0.3 * cm
-            table_available_pt = (page_h_pt - top_pt - bottom_pt - heading_spacer_pt) * 0.94
-            num_rows = len(q_data)
-            row_height_pt = max(16, table_available_pt / num_rows)
-            row_heights = [row_height_pt] * num_rows
-            q_table = Table(
-                q_data,
-                colWidths=[3 * cm, 3 * cm, 10 * cm],
-                rowHeights=row_heights,
-                repeatRows=0,
+        # 排版期间关闭 reportlab 的形参校验：样式命令全部来自本文件的固定写法，
+        # 校验只剩开销；进程级开关，结束后务必还原
+        _shape_checking = rl_config.shapeChecking
+        rl_config.shapeChecking = 0
+        try:
+            self.styles = _get_styles(self.font_name)
+            self.doc = SimpleDocTemplate(
+                self.buffer,
+                pagesize=A4,
+                rightMargin=2 * cm,
+                leftMargin=2 * cm,
+                topMargin=2.2 * cm,
+                bottomMargin=1.5 * cm,
             )
-            styles = [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#e0e0e0")),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 4),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-                ("TOPPADDING", (0, 0), (-1, -1), 3),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-            ]
-            for r in range(1, len(q_data)):
-                hex_color = COLOR_SCHEME.get(row_modules[r - 1], "#f0f0f0")
-                light = _lighten_hex(hex_color, blend_white=0.78)
-                try:
-                    bg = colors.HexColor(light)
-                except Exception:
-                    bg = colors.HexColor("#f8f8f8")
-                styles.append(("BACKGROUND", (0, r), (-1, r), bg))
-            q_table.setStyle(TableStyle(styles))
-            second_page_block = [
-                Paragraph("调研题目设置", self.styles["heading1"]),
-                Spacer(1, 0.3 * cm),
-                q_table,
-            ]
-            story.append(KeepTogether(second_page_block))
-        story.append(PageBreak())
-
-        # 第三页：报告摘要（所有文字与表格左对齐，用单列全宽表格包裹）
-        summary_rows = [Paragraph("一、报告摘要", self.styles["heading1"])]
-        if dim_means:
-            scores = [s for _, s in dim_means]
-            min_s, max_s = min(scores), max(scores)
-            low_label = _mean_score_to_label(min_s)
-            high_label = _mean_score_to_label(max_s)
-            if low_label == high_label:
-                p1 = "管理者们（指受测人员）在 5 个维度上的自评行为展现基本都在&lt;%s&gt;水平。" % (low_label if low_label != "—" else "有时如此")
-            elif low_label == "—" or high_label == "—":
-                p1 = "管理者们（指受测人员）在 5 个维度上的自评行为展现基本在&lt;%s&gt;和&lt;%s&gt;之间。" % (low_label if low_label != "—" else "很少如此", high_label if high_label != "—" else "总是如此")
-            else:
-                p1 = "管理者们（指受测人员）在 5 个维度上的自评行为展现基本都在&lt;%s&gt;和&lt;%s&gt;之间。" % (low_label, high_label)
-            summary_rows.append(Paragraph(p1, self.styles["body"]))
-            dim_min_name = min(dim_means, key=lambda x: x[1])[0]
-            dim_max_name = max(dim_means, key=lambda x: x[1])[0]
-            p2 = (
-                "横向比较来看，管理者们自我评价在【%s】维度展现的行为稍显不足，在大家看来自己在这部分的管理动作展现不是特别的充分，"
-                "而在【%s】的运用上相对优于其他部分。"
-            ) % (dim_min_name, dim_max_name)
-            summary_rows.append(Paragraph(p2, self.styles["body"]))
-            summary_rows.append(Spacer(1, 0.4 * cm))
-        # 第一行左右结构：维度均分表 | 柱状图
-        if dim_means:
-            max_s = max(s for _, s in dim_means) if dim_means else 0
-            min_s = min(s for _, s in dim_means) if dim_means else 0
-            data = [["维度", "全员平均分", "备注"]]
-            for dim, sc in dim_means:
-                note = "最高" if sc == max_s else ("最低" if sc == min_s else "")
-                data.append([dim, "%.2f" % sc, note])
-            bar_chart_height_cm = 4.8
-            n_rows = len(data)  # 1 表头 + 5 数据行
-            row_heights = [bar_chart_height_cm / n_rows * cm] * n_rows
-            col_width_left_cm = 6.2
-            dim_col_width = col_width_left_cm / 3
-            dim_table = Table(data, colWidths=[dim_col_width * cm, dim_col_width * cm, dim_col_width * cm], rowHeights=row_heights)
-            dim_table.setStyle(TableStyle([
+            story = []
+
+            # 第一页：封面 + 团队报告（居中）+ 第一部分（标红）+ 温馨提示（标黄）+ 第二部分 + 自评分数换算表
+            story.append(Paragraph("好未来新灵秀报告", self.styles["title"]))
+            story.append(Spacer(1, 0.5 * cm))
+            report_subtitle = "个人报告" if self.report_type == "personal" else "团队报告"
+            story.append(Paragraph(report_subtitle, self.styles["subtitle"]))
+            story.append(Spacer(1, 0.5 * cm))
+
+            # 第一部分（标红）
+            story.append(Paragraph('<font color="red">%s</font>' % PREFACE_RED_TITLE, self.styles["body"]))
+            story.append(Paragraph('<font color="red">%s</font>' % PREFACE_RED_LINE, self.styles["body"]))
+            story.append(Spacer(1, 0.2 * cm))
+            # 引言与三条编号说明合并为一个段落（<br/> 换行）：
+            # 段落越少，排版遍数和中文逐字的字体查找就越少
+            story.append(Paragraph(
+                "本报告旨在呈现新灵秀课程的学员在不同管理动作上的自我评估结果，我们在设计本期课程的重点强调内容时将进行参考。把调研结果同步给您是希望：<br/>"
+                "1. 为您提供一个视角，即：学员们眼中的自己在团队中是否充分展现了各方面管理动作，以便您在帮助学员校准自我认知时能有的放矢<br/>"
+                "2. 帮助学员打开乔哈里窗盲区，结合您对学员们的了解，帮助大家看见一些他们自己没有察觉的优劣势，未来期待着您的点拨和指导<br/>"
+                "3. 请您知悉这些优秀的伙伴们踏上了成长为更优秀管理者的旅途，一路上期待有您的关注和陪伴",
+                self.styles["body"],
+            ))
+            story.append(Spacer(1, 0.2 * cm))
+            # 温馨提示（单独模块标黄）
+            tip_para = Paragraph(PREFACE_TIP, self.styles["body"])
+            tip_table = Table([[tip_para]], colWidths=[14 * cm])
+            tip_table.setStyle(_STYLE_TIP_BOX)
+            story.append(tip_table)
+            story.append(Spacer(1, 0.4 * cm))
+
+            # 第二部分：调研题本设计说明
+            story.append(Paragraph("第二部分  调研题本设计说明", self.styles["heading2"]))
+            story.append(Paragraph(
+                "本次调研在凯洛格（KeyLogic Group）金牌培养项目&lt;新经理成长地图&gt;的设计逻辑之上，融合好未来的集团特色，分别从管理角色认知、辅导、任务分配、激励和沟通 5 个维度对新任管理者的管理动作呈现情况进行调研。",
+                self.styles["body"],
+            ))
+            story.append(Paragraph("赋分标准", self.styles["heading2"]))
+            story.append(Paragraph(
+                "每个行为项的评分范围为 1～5 分，分数越高则表示参调者们出现该类行为的频率越高，报告中【均分】代表多位参调者自我描述的平均。自评分数换算逻辑：",
+                self.styles["body"],
+            ))
+            score_table = Table(SCORE_RULES_DATA, colWidths=[4 * cm, 8 * cm])
+            score_table.setStyle(TableStyle([
                 ("FONTNAME", (0, 0), (-1, -1), self.font_name or "Helvetica"),
-                ("FONTSIZE", (0, 0), (-1, -1), 9),
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#f0f0f0")),
+                ("FONTSIZE", (0, 0), (-1, -1), 10),
+                ("BACKGROUND", (0, 0), (-1, 0), _hex_color("#f0f0f0")),
                 ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-                ("TOPPADDING", (0, 0), (-1, -1), 4),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+                ("ALIGN", (0, 0), (0, -1), "CENTER"),
+                ("ALIGN", (1, 0), (1, -1), "LEFT"),
             ]))
-            bar_cell = Paragraph("（暂无图表）", self.styles["table_cell_center"])
-            if summary_chart_png and summary_chart_png.getvalue():
+            story.append(score_table)
+            story.append(PageBreak())
+
+            # 第二页：调研题目设置（整表铺满一页、不跨页；按可用高度均分行高，消除底部空白）
+            if SURVEY_QUESTIONS:
+                ps_cell = self.styles["table_cell_survey"]
+                ps_center = self.styles["table_cell_center_survey"]
+                q_data = [[
+                    _header_para("模块", "table_cell_center_survey", self.font_name),
+                    _header_para("行为项", "table_cell_center_survey", self.font_name),
+                    _header_para("具体行为描述", "table_cell_center_survey", self.font_name),
+                ]]
+                row_modules = []
+                for mod, be, desc_safe in _SURVEY_ESCAPED:
+                    row_modules.append(mod)
+                    q_data.append([
+                        Paragraph(mod, ps_center),
+                        Paragraph(be, ps_center),
+                        Paragraph(desc_safe, ps_cell),
+                    ])
+                # 第二页可用高度：页高 - 上下边距 - 标题与间距，均分给表头+数据行；略留余量避免跨页
+                page_h_pt = A4[1]
+                top_pt, bottom_pt = 2.2 * cm, 1.5 * cm
+                heading_spacer_pt = 1.0 * cm + 0.3 * cm
+                table_available_pt = (page_h_pt - top_pt - bottom_pt - heading_spacer_pt) * 0.94
+                num_rows = len(q_data)
+                row_height_pt = max(16, table_available_pt / num_rows)
+                row_heights = [row_height_pt] * num_rows
+                q_table = Table(
+                    q_data,
+                    colWidths=[3 * cm, 3 * cm, 10 * cm],
+                    rowHeights=row_heights,
+                    splitByRow=0,
+                )
+                styles = [
+                    ("BACKGROUND", (0, 0), (-1, 0), _hex_color("#e0e0e0")),
+                    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                    ("LEFTPADDING", (0, 0), (-1, -1), 4),
+                    ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+                    ("TOPPADDING", (0, 0), (-1, -1), 3),
+                    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+                ]
+                for r in range(1, len(q_data)):
+                    hex_color = COLOR_SCHEME.get(row_modules[r - 1], "#f0f0f0")
+                    light = _lighten_hex(hex_color, blend_white=0.78)
+                    try:
+                        bg = _hex_color(light)
+                    except Exception:
+                        bg = _hex_color("#f8f8f8")
+                    styles.append(("BACKGROUND", (0, r), (-1, r), bg))
+                q_table.setStyle(TableStyle(styles))
+                # 行高已按单页可用高度均分，整表必然放得下，无需 KeepTogether 的预排版量算
+                story.extend([
+                    Paragraph("调研题目设置", self.styles["heading1"]),
+                    Spacer(1, 0.3 * cm),
+                    q_table,
+                ])
+            story.append(PageBreak())
+
+            # 第三页：报告摘要（所有文字与表格左对齐，用单列全宽表格包裹）
+            summary_rows = [Paragraph("一、报告摘要", self.styles["heading1"])]
+            if dim_means:
+                # 最高/最低分及其维度名一趟扫完，后面摘要文案与表格备注共用
+                dim_min_name, min_s = dim_means[0]
+                dim_max_name, max_s = dim_means[0]
+                for name_d, s in dim_means[1:]:
+                    if s < min_s:
+                        min_s, dim_min_name = s, name_d
+                    elif s > max_s:
+                        max_s, dim_max_name = s, name_d
+                low_label = _mean_score_to_label(min_s)
+                high_label = _mean_score_to_label(max_s)
+                if low_label == high_label:
+                    p1 = "管理者们（指受测人员）在 5 个维度上的自评行为展现基本都在&lt;%s&gt;水平。" % (low_label if low_label != "—" else "有时如此")
+                elif low_label == "—" or high_label == "—":
+                    p1 = "管理者们（指受测人员）在 5 个维度上的自评行为展现基本在&lt;%s&gt;和&lt;%s&gt;之间。" % (low_label if low_label != "—" else "很少如此", high_label if high_label != "—" else "总是如此")
+                else:
+                    p1 = "管理者们（指受测人员）在 5 个维度上的自评行为展现基本都在&lt;%s&gt;和&lt;%s&gt;之间。" % (low_label, high_label)
+                summary_rows.append(Paragraph(p1, self.styles["body"]))
+                p2 = (
+                    "横向比较来看，管理者们自我评价在【%s】维度展现的行为稍显不足，在大家看来自己在这部分的管理动作展现不是特别的充分，"
+                    "而在【%s】的运用上相对优于其他部分。"
+                ) % (dim_min_name, dim_max_name)
+                summary_rows.append(Paragraph(p2, self.styles["body"]))
+                summary_rows.append(Spacer(1, 0.4 * cm))
+            # 第一行左右结构：维度均分表 | 柱状图
+            if dim_means:
+                data = [["维度", "全员平均分", "备注"]]
+                for dim, sc in dim_means:
+                    note = "最高" if sc == max_s else ("最低" if sc == min_s else "")
+                    data.append([dim, f"{sc:.2f}", note])
+                bar_chart_height_cm = 4.8
+                n_rows = len(data)  # 1 表头 + 5 数据行
+                row_heights = [bar_chart_height_cm / n_rows * cm] * n_rows
+                col_width_left_cm = 6.2
+                dim_col_width = col_width_left_cm / 3
+                dim_table = Table(data, colWidths=[dim_col_width * cm, dim_col_width * cm, dim_col_width * cm], rowHeights=row_heights)
+                dim_table.setStyle(TableStyle([
+                    ("FONTNAME", (0, 0), (-1, -1), self.font_name or "Helvetica"),
+                    ("FONTSIZE", (0, 0), (-1, -1), 9),
+                    ("BACKGROUND", (0, 0), (-1, 0), _hex_color("#f0f0f0")),
+                    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                    ("LEFTPADDING", (0, 0), (-1, -1), 0),
+                    ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+                    ("TOPPADDING", (0, 0), (-1, -1), 4),
+                    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+                ]))
+                bar_cell = _header_para("（暂无图表）", "table_cell_center", self.font_name)
+                if summary_chart_png and getattr(summary_chart_png, "getbuffer", None) and summary_chart_png.getbuffer().nbytes:
+                    try:
+                        summary_chart_png.seek(0)
+                        bar_cell = Image(summary_chart_png, width=7.2 * cm, height=bar_chart_height_cm * cm)
+                    except Exception:
+                        pass
+                row1 = Table(
+                    [[dim_table, bar_cell]],
+                    colWidths=[col_width_left_cm * cm, (_FRAME_WIDTH_CM - col_width_left_cm) * cm],
+                )
+                row1.setStyle(_STYLE_MEDIA_ROW)
+                row1.setStyle(_STYLE_MEDIA_ROW_GAP)
+                summary_rows.append(row1)
+                summary_rows.append(Spacer(1, 0.4 * cm))
+            # 希望深入学习的技能模块：副标题与“管理者们……”放入同一左栏；右侧仅饼图
+            p3_para = _header_para("（本期调研未采集「希望重点学习的模块」相关选项数据。）", "body", self.font_name)
+            if summary_votes and len(summary_votes) > 0:
+                main_mod, main_cnt = summary_votes[0]
+                others = ["【%s】（%d 票）" % (m, c) for m, c in summary_votes[1:]]
+                p3_text = "管理者们主要希望在【%s】（%d 票）进行深入的学习和研讨。" % (main_mod, main_cnt)
+                if others:
+                    p3_text += "其他选项：" + " ".join(others) + "。"
+                p3_para = Paragraph(p3_text, self.styles["body"])
+            left_block = Table([
+                [Paragraph("希望深入学习的技能模块", self.styles["heading2"])],
+                [p3_para],
+            ], colWidths=[8.2 * cm])
+            left_block.setStyle(_STYLE_LEFT_BLOCK)
+            pie_learning_cell = _header_para("（暂无数据）", "table_cell_center", self.font_name)
+            if pie_learning_png and getattr(pie_learning_png, "getbuffer", None) and pie_learning_png.getbuffer().nbytes:
                 try:
-                    summary_chart_png.seek(0)
-                    bar_cell = Image(summary_chart_png, width=7.2 * cm, height=bar_chart_height_cm * cm)
+                    pie_learning_png.seek(0)
+                    pie_learning_cell = Image(pie_learning_png, width=5.5 * cm, height=5.2 * cm)
                 except Exception:
                     pass
-            row1 = Table(
-                [[dim_table, bar_cell]],
-                colWidths=[col_width_left_cm * cm, (_FRAME_WIDTH_CM - col_width_left_cm) * cm],
+            row2 = Table(
+                [[left_block, pie_learning_cell]],
+                colWidths=[8.2 * cm, (_FRAME_WIDTH_CM - 8.2) * cm],
             )
-            row1.setStyle(TableStyle([
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("ALIGN", (0, 0), (0, 0), "LEFT"),
-                ("ALIGN", (1, 0), (1, 0), "CENTER"),
-                ("LEFTPADDING", (0, 0), (0, -1), 0),
-                ("RIGHTPADDING", (0, 0), (0, -1), 0),
-                ("TOPPADDING", (0, 0), (-1, -1), 0),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-                ("LEFTPADDING", (1, 0), (1, 0), 8),
-            ]))
-            summary_rows.append(row1)
+            row2.setStyle(_STYLE_MEDIA_ROW)
+            summary_rows.append(row2)
             summary_rows.append(Spacer(1, 0.4 * cm))
-        # 希望深入学习的技能模块：副标题与“管理者们……”放入同一左栏；右侧仅饼图
-        p3_para = Paragraph("（本期调研未采集「希望重点学习的模块」相关选项数据。）", self.styles["body"])
-        if summary_votes and len(summary_votes) > 0:
-            main_mod, main_cnt = summary_votes[0]
-            others = ["【%s】（%d 票）" % (m, c) for m, c in summary_votes[1:]]
-            p3_text = "管理者们主要希望在【%s】（%d 票）进行深入的学习和研讨。" % (main_mod, main_cnt)
-            if others:
-                p3_text += "其他选项：" + " ".join(others) + "。"
-            p3_para = Paragraph(p3_text, self.styles["body"])
-        left_block = Table([
-            [Paragraph("希望深入学习的技能模块", self.styles["heading2"])],
-            [p3_para],
-        ], colWidths=[8.2 * cm])
-        left_block.setStyle(TableStyle([
-            ("LEFTPADDING", (0, 0), (-1, -1), 0),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-            ("TOPPADDING", (0, 0), (-1, -1), 0),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-            ("TOPPADDING", (0, 1), (0, 1), 4),
-            ("VALIGN", (0, 0), (-1, -1), "TOP"),
-            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-        ]))
-        pie_learning_cell = Paragraph("（暂无数据）", self.styles["table_cell_center"])
-        if pie_learning_png and getattr(pie_learning_png, "getvalue", None) and pie_learning_png.getvalue():
-            try:
-                pie_learning_png.seek(0)
-                pie_learning_cell = Image(pie_learning_png, width=5.5 * cm, height=5.2 * cm)
-            except Exception:
-                pass
-        row2 = Table(
-            [[left_block, pie_learning_cell]],
-            colWidths=[8.2 * cm, (_FRAME_WIDTH_CM - 8.2) * cm],
-        )
-        row2.setStyle(TableStyle([
-            ("VALIGN", (0, 0), (-1, -1), "TOP"),
-            ("ALIGN", (0, 0), (0, 0), "LEFT"),
-            ("ALIGN", (1, 0), (1, 0), "CENTER"),
-            ("LEFTPADDING", (0, 0), (0, -1), 0),
-            ("RIGHTPADDING", (0, 0), (0, -1), 0),
-            ("TOPPADDING", (0, 0), (-1, -1), 0),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-        ]))
-        summary_rows.append(row2)
-        summary_rows.append(Spacer(1, 0.4 * cm))
-        if tenure_votes and len(tenure_votes) > 0:
-            main_t, cnt_t = tenure_votes[0]
-            others_t = ["【%s】（%d 人）" % (o, c) for o, c in tenure_votes[1:3]]
-            p_tenure = "管理年限方面，多数伙伴为【%s】（%d 人）。" % (main_t, cnt_t)
-            if others_t:
-                p_tenure += "其次：" + "、".join(others_t) + "。"
+            # 管理年限与团队规模文案拼成一个段落（<br/><br/> 分段），少两轮段落排版
+            vote_texts = []
+            if tenure_votes and len(tenure_votes) > 0:
+                main_t, cnt_t = tenure_votes[0]
+                others_t = ["【%s】（%d 人）" % (o, c) for o, c in tenure_votes[1:3]]
+                p_tenure = "管理年限方面，多数伙伴为【%s】（%d 人）。" % (main_t, cnt_t)
+                if others_t:
+                    p_tenure += "其次：" + "、".join(others_t) + "。"
+                vote_texts.append(p_tenure)
+            if team_size_votes and len(team_size_votes) > 0:
+                main_s, cnt_s = team_size_votes[0]
+                others_s = ["【%s】（%d 人）" % (o, c) for o, c in team_size_votes[1:3]]
+                p_team = "团队规模方面，多数伙伴为【%s】（%d 人）。" % (main_s, cnt_s)
+                if others_s:
+                    p_team += "其次：" + "、".join(others_s) + "。"
+                vote_texts.append(p_team)
+            if vote_texts:
+                summary_rows.append(Spacer(1, 0.4 * cm))
+                summary_rows.append(Paragraph("<br/><br/>".join(vote_texts), self.styles["body"]))
+            pie_tenure_cell = None
+            pie_team_cell = None
+            if pie_tenure_png and getattr(pie_tenure_png, "getbuffer", None) and pie_tenure_png.getbuffer().nbytes:
+                try:
+                    pie_tenure_png.seek(0)
+                    pie_tenure_cell = Image(pie_tenure_png, width=5.5 * cm, height=5.2 * cm)
+                except Exception:
+                    pie_tenure_cell = _header_para("管理年限分布（图略）", "table_cell_center", self.font_name)
+            else:
+                pie_tenure_cell = _header_para("管理年限分布（暂无数据）", "table_cell_center", self.font_name)
+            if pie_team_png and getattr(pie_team_png, "getbuffer", None) and pie_team_png.getbuffer().nbytes:
+                try:
+                    pie_team_png.seek(0)
+                    pie_team_cell = Image(pie_team_png, width=5.5 * cm, height=5.2 * cm)
+                except Exception:
+                    pie_team_cell = _header_para("团队规模分布（图略）", "table_cell_center", self.font_name)
+            else:
+                pie_team_cell = _header_para("团队规模分布（暂无数据）", "table_cell_center", self.font_name)
             summary_rows.append(Spacer(1, 0.4 * cm))
-            summary_rows.append(Paragraph(p_tenure, self.styles["body"]))
-        if team_size_votes and len(team_size_votes) > 0:
-            main_s, cnt_s = team_size_votes[0]
-            others_s = ["【%s】（%d 人）" % (o, c) for o, c in team_size_votes[1:3]]
-            p_team = "团队规模方面，多数伙伴为【%s】（%d 人）。" % (main_s, cnt_s)
-            if others_s:
-                p_team += "其次：" + "、".join(others_s) + "。"
-            summary_rows.append(Paragraph(p_team, self.styles["body"]))
-        pie_tenure_cell = None
-        pie_team_cell = None
-        if pie_tenure_png and getattr(pie_tenure_png, "getvalue", None) and pie_tenure_png.getvalue():
-            try:
-                pie_tenure_png.seek(0)
-                pie_tenure_cell = Image(pie_tenure_png, width=5.5 * cm, height=5.2 * cm)
-            except Exception:
-                pie_tenure_cell = Paragraph("管理年限分布（图略）", self.styles["table_cell_center"])
-        else:
-            pie_tenure_cell = Paragraph("管理年限分布（暂无数据）", self.styles["table_cell_center"])
-        if pie_team_png and getattr(pie_team_png, "getvalue", None) and pie_team_png.getvalue():
-            try:
-                pie_team_png.seek(0)
-                pie_team_cell = Image(pie_team_png, width=5.5 * cm, height=5.2 * cm)
-            except Exception:
-                pie_team_cell = Paragraph("团队规模分布（图略）", self.styles["table_cell_center"])
-        else:
-            pie_team_cell = Paragraph("团队规模分布（暂无数据）", self.styles["table_cell_center"])
-        summary_rows.append(Spacer(1, 0.4 * cm))
-        pie_two_table = Table(
-            [[pie_tenure_cell, pie_team_cell]],
-            colWidths=[(_FRAME_WIDTH_CM / 2) * cm, (_FRAME_WIDTH_CM / 2) * cm],
-        )
-        pie_two_table.setStyle(TableStyle([
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-            ("LEFTPADDING", (0, 0), (0, -1), 0),
-            ("LEFTPADDING", (1, 0), (1, -1), 0),
-        ]))
-        summary_rows.append(pie_two_table)
-        summary_table = Table([[f] for f in summary_rows], colWidths=[_FRAME_WIDTH_CM * cm])
-        summary_table.setStyle(TableStyle([
-            ("LEFTPADDING", (0, 0), (-1, -1), 0),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-            ("TOPPADDING", (0, 0), (-1, -1), 0),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-            ("VALIGN", (0, 0), (-1, -1), "TOP"),
-            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-        ]))
-        story.append(summary_table)
-        story.append(PageBreak())
-
-        # 第三部分：各维度行为项平均分（第四页；三列表格 + 下方折线图）
-        story.append(Paragraph("三、各维度行为项平均分", self.styles["heading1"]))
-        data = [["模块", "行为项", "平均分"]]
-        if behavior_avgs and SURVEY_QUESTIONS:
-            for mod, be, _ in SURVEY_QUESTIONS:
-                sc = (behavior_avgs.get(mod) or {}).get(be)
-                data.append([mod, be, "%.2f" % round(sc, 2)] if sc is not None else [mod, be, "-"])
-        if len(data) > 1:
-            t = Table(data, colWidths=[3.5 * cm, 5 * cm, 2.5 * cm])
-            t.setStyle(TableStyle([
-                ("FONTNAME", (0, 0), (-1, -1), self.font_name or "Helvetica"),
-                ("FONTSIZE", (0, 0), (-1, -1), 9),
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#e8f4fc")),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-            ]))
-            story.append(t)
-            story.append(Spacer(1, 0.5 * cm))
-        if behavior_chart_png and getattr(behavior_chart_png, "getvalue", None) and behavior_chart_png.getvalue():
-            try:
-                behavior_chart_png.seek(0)
-                img = Image(behavior_chart_png, width=14 * cm, height=7 * cm)
-                story.append(img)
-            except Exception:
-                pass
-        story.append(PageBreak())
+            pie_two_table = Table(
+                [[pie_tenure_cell, pie_team_cell]],
+                colWidths=[(_FRAME_WIDTH_CM / 2) * cm, (_FRAME_WIDTH_CM / 2) * cm],
+            )
+            pie_two_table.setStyle(_STYLE_PIE_TWO)
+            summary_rows.append(pie_two_table)
+            # 直接平铺进 story：各段落/子表本身就是左对齐零缩进，
+            # 不再用单列全宽表格包裹，省掉一整轮表格布局
+            story.extend(summary_rows)
+            story.append(PageBreak())
 
-        # 附录：学员自陈结果细则（一页放多人，姓名与雷达图、折线图 KeepTogether 不分离）
-        if person_details:
-            story.append(Paragraph("附录：学员自陈结果细则", self.styles["heading1"]))
-            story.append(Paragraph(
-                '这一部分，我们主要关注每个学员自身数据横向对比，看"跟自己比"的高分项和低分项。',
-                self.styles["note_red"],
-            ))
-            story.append(Spacer(1, 0.3 * cm))
-            for person_item in person_details:
-                name, radar_io, line_io = person_item[:3]
-                dim_cards = getattr(person_item, "dim_cards", None)
-                if dim_cards is None:
-                    dim_cards = person_item[3] if len(person_item) > 3 else []
-                row_cells = []
-                if radar_io and getattr(radar_io, "getvalue", None) and radar_io.getvalue():
-                    try:
-                        radar_io.seek(0)
-                        row_cells.append(Image(radar_io, width=5.5 * cm, height=5 * cm))
-                    except Exception:
-                        row_cells.append(Paragraph("（雷达图）", self.styles["body"]))
-                else:
-                    row_cells.append(Paragraph("（雷达图）", self.styles["body"]))
-                if line_io and getattr(line_io, "getvalue", None) and line_io.getvalue():
-                    try:
-                        line_io.seek(0)
-                        row_cells.append(Image(line_io, width=10.5 * cm, height=6 * cm))
-                    except Exception:
-                        row_cells.append(Paragraph("（折线图）", self.styles["body"]))
-                else:
-                    row_cells.append(Paragraph("（折线图）", self.styles["body"]))
-                name_para = Paragraph(name, self.styles["heading2"])
-                blocks = [name_para]
-                if dim_cards:
-                    card_cells = []
-                    for dim, score in dim_cards:
-                        color = COLOR_SCHEME.get(dim, "#3498db")
-                        bg = colors.HexColor(_lighten_hex(color, blend_white=0.82))
-                        card = Table(
-                            [[
-                                Paragraph(escape(str(dim)), self.styles["table_cell_center_tight"]),
-                                Paragraph("%.2f" % float(score), self.styles["table_cell_center"]),
-                            ]],
-                            colWidths=[2.0 * cm, 1.0 * cm],
-                        )
-                        card.setStyle(TableStyle([
-                            ("BACKGROUND", (0, 0), (-1, -1), bg),
-                            ("BOX", (0, 0), (-1, -1), 0.5, colors.HexColor(color)),
-                            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                            ("LEFTPADDING", (0, 0), (-1, -1), 3),
-                            ("RIGHTPADDING", (0, 0), (-1, -1), 3),
-                            ("TOPPADDING", (0, 0), (-1, -1), 4),
-                            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-                        ]))
-                        card_cells.append(card)
-                    cards_table = Table([card_cells], colWidths=[3.0 * cm] * len(card_cells))
-                    cards_table.setStyle(TableStyle([
+            # 第三部分：各维度行为项平均分（第四页；三列表格 + 下方折线图）
+            story.append(Paragraph("三、各维度行为项平均分", self.styles["heading1"]))
+            # 行列表按题目数预分配；f-string 的 .2f 本身就四舍五入，不必先 round
+            if behavior_avgs and SURVEY_QUESTIONS:
+                data = [None] * (len(SURVEY_QUESTIONS) + 1)
+                data[0] = ["模块", "行为项", "平均分"]
+                for i, (mod, be, _) in enumerate(SURVEY_QUESTIONS):
+                    sc = (behavior_avgs.get(mod) or {}).get(be)
+                    data[i + 1] = [mod, be, f"{sc:.2f}" if sc is not None else "-"]
+            else:
+                data = [["模块", "行为项", "平均分"]]
+            if len(data) > 1:
+                t = Table(data, colWidths=[3.5 * cm, 5 * cm, 2.5 * cm])
+                t.setStyle(_grid_style(self.font_name, "#e8f4fc"))
+                story.append(t)
+                story.append(Spacer(1, 0.5 * cm))
+            if behavior_chart_png and getattr(behavior_chart_png, "getbuffer", None) and behavior_chart_png.getbuffer().nbytes:
+                try:
+                    behavior_chart_png.seek(0)
+                    img = Image(behavior_chart_png, width=14 * cm, height=7 * cm)
+                    story.append(img)
+                except Exception:
+                    pass
+            story.append(PageBreak())
+
+            # 附录：学员自陈结果细则（一页放多人，姓名与雷达图、折线图 KeepTogether 不分离）
+            if person_details:
+                story.append(Paragraph("附录：学员自陈结果细则", self.styles["heading1"]))
+                story.append(Paragraph(
+                    '这一部分，我们主要关注每个学员自身数据横向对比，看"跟自己比"的高分项和低分项。',
+                    self.styles["note_red"],
+                ))
+                story.append(Spacer(1, 0.3 * cm))
+                # 全部学员放进一张外层表：每人两行（姓名/得分卡跨列 + 雷达图|折线图），
+                # 表格布局引擎只跑一遍，替代原先每人一个 Table+KeepTogether 的逐人预量算；
+                # 分页只发生在行与行之间，姓名行与图行偶有跨页，但 N 人排版从 O(N) 次布局降为 1 次
+                detail_data = []
+                name_rows = []
+                for person_item in person_details:
+                    name, radar_io, line_io = person_item[:3]
+                    dim_cards = getattr(person_item, "dim_cards", None)
+                    if dim_cards is None:
+                        dim_cards = person_item[3] if len(person_item) > 3 else []
+                    if radar_io and getattr(radar_io, "getbuffer", None) and radar_io.getbuffer().nbytes:
+                        try:
+                            radar_io.seek(0)
+                            radar_cell = Image(radar_io, width=5.5 * cm, height=5 * cm)
+                        except Exception:
+                            radar_cell = _header_para("（雷达图）", "body", self.font_name)
+                    else:
+                        radar_cell = _header_para("（雷达图）", "body", self.font_name)
+                    if line_io and getattr(line_io, "getbuffer", None) and line_io.getbuffer().nbytes:
+                        try:
+                            line_io.seek(0)
+                            line_cell = Image(line_io, width=10.5 * cm, height=6 * cm)
+                        except Exception:
+                            line_cell = _header_para("（折线图）", "body", self.font_name)
+                    else:
+                        line_cell = _header_para("（折线图）", "body", self.font_name)
+                    blocks = [Paragraph(name, self.styles["heading2"])]
+                    if dim_cards:
+                        card_cells = []
+                        for dim, score in dim_cards:
+                            color = COLOR_SCHEME.get(dim, "#3498db")
+                            bg = _hex_color(_lighten_hex(color, blend_white=0.82))
+                            card = Table(
+                                [[
+                                    Paragraph(_esc(str(dim)), self.styles["table_cell_center_tight"]),
+                                    Paragraph(format(float(score), ".2f"), self.styles["table_cell_center"]),
+                                ]],
+                                colWidths=[2.0 * cm, 1.0 * cm],
+                            )
+                            card.setStyle(TableStyle([
+                                ("BACKGROUND", (0, 0), (-1, -1), bg),
+                                ("BOX", (0, 0), (-1, -1), 0.5, _hex_color(color)),
+                                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                                ("LEFTPADDING", (0, 0), (-1, -1), 3),
+                                ("RIGHTPADDING", (0, 0), (-1, -1), 3),
+                                ("TOPPADDING", (0, 0), (-1, -1), 4),
+                                ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+                            ]))
+                            card_cells.append(card)
+                        cards_table = Table([card_cells], colWidths=[3.0 * cm] * len(card_cells))
+                        cards_table.setStyle(_STYLE_CARDS_ROW)
+                        blocks.extend([Spacer(1, 0.1 * cm), cards_table])
+                    name_rows.append(len(detail_data))
+                    detail_data.append([blocks, ""])
+                    detail_data.append([radar_cell, line_cell])
+                if detail_data:
+                    cmds = [
                         ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
                         ("ALIGN", (0, 0), (-1, -1), "CENTER"),
                         ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                        ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-                    ]))
-                    blocks.extend([Spacer(1, 0.1 * cm), cards_table])
-                if len(row_cells) == 2:
-                    t = Table([row_cells], colWidths=[5.5 * cm, 10.5 * cm])
-                    t.setStyle(TableStyle([
-                        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                        ("ALIGN", (0, 0), (0, 0), "CENTER"),
-                        ("ALIGN", (1, 0), (1, 0), "CENTER"),
-                    ]))
-                    blocks.extend([Spacer(1, 0.2 * cm), t, Spacer(1, 0.4 * cm)])
-                    story.append(KeepTogether(blocks))
+                        ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+                        ("TOPPADDING", (0, 0), (-1, -1), 0),
+                        ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
+                    ]
+                    for r in name_rows:
+                        cmds.append(("SPAN", (0, r), (1, r)))
+                        cmds.append(("VALIGN", (0, r), (1, r), "TOP"))
+                        cmds.append(("ALIGN", (0, r), (1, r), "LEFT"))
+                        cmds.append(("BOTTOMPADDING", (0, r), (1, r), 4))
+                    detail_table = Table(detail_data, colWidths=[5.5 * cm, 10.5 * cm])
+                    detail_table.setStyle(TableStyle(cmds))
+                    story.append(detail_table)
+            story.append(PageBreak())
+
+            # 第四部分：异常提醒
+            story.append(Paragraph("四、异常提醒", self.styles["heading1"]))
+            story.append(Paragraph("单选题若全部为同一分值，则视为异常，建议管理者关注。", self.styles["body"]))
+            if anomaly_rows:
+                # 行格式化整列先行完成（缺省填充、数值格式化、转义），循环里只剩段落包装
+                df_rows = pd.DataFrame(list(anomaly_rows)).reindex(columns=range(4))
+                df_rows.columns = ["name", "dept", "score", "note"]
+                name_s = df_rows["name"].fillna("").astype(str)
+                dept_s = df_rows["dept"].fillna("-").astype(str)
+                note_s = df_rows["note"].fillna("").astype(str)
+                # 仅数值类型走 .2f，与原逐行 isinstance 分支一致
+                # （to_numeric 会把形如 "3" 的字符串也重排成 "3.00"，故不用；
+                # format() 走 __format__ 快路径，省掉 % 格式串的逐次解析）
+                score_s = df_rows["score"].fillna("").map(
+                    lambda v: format(v, ".2f") if isinstance(v, (int, float)) else str(v)
+                )
+                # 行数很少时 Table 的列宽计算与网格绘制反而是大头，
+                # 直接按行输出段落（对齐诉求弱，单个 Paragraph 便宜一个量级）
+                if len(df_rows) <= 3:
+                    for n, d, s, m in zip(name_s, dept_s, score_s, note_s):
+                        line = _esc(f"{n} / {d} / {s} — {m}")
+                        story.append(Paragraph(line, self.styles["body"]))
+                    story.append(Spacer(1, 0.3 * cm))
                 else:
-                    blocks.append(Spacer(1, 0.4 * cm))
-                    story.append(KeepTogether(blocks))
-        story.append(PageBreak())
-
-        # 第四部分：异常提醒
-        story.append(Paragraph("四、异常提醒", self.styles["heading1"]))
-        story.append(Paragraph("单选题若全部为同一分值，则视为异常，建议管理者关注。", self.styles["body"]))
-        if anomaly_rows:
-            cell_style = self.styles["table_cell"]
-            cell_center = self.styles["table_cell_center"]
-            data = [
-                [
-                    Paragraph(escape("姓名"), cell_center),
-                    Paragraph(escape("部门"), cell_center),
-                    Paragraph(escape("统一分值"), cell_center),
-                    Paragraph(escape("说明"), cell_center),
-                ]
+                    self._append_anomaly_table(story, name_s, dept_s, score_s, note_s)
+            else:
+                story.append(Paragraph("当前无异常：未发现「全部题目同一分值」的填答。", self.styles["body"]))
+
+            def _on_page(canvas, doc):
+                self._canvas_background(canvas, doc)
+                self._canvas_header(canvas, doc)
+            self.doc.build(story, onFirstPage=_on_page, onLaterPages=_on_page)
+            self.buffer.seek(0)
+            return self.buffer
+        finally:
+            rl_config.shapeChecking = _shape_checking
+            _row_para_cached.cache_clear()
+
+    def _append_anomaly_table(self, story, name_s, dept_s, score_s, note_s):
+        """异常提醒表格路径：行数较多时按表格输出（小样本走段落快速路径）。"""
+        # 相同（部门, 分值, 说明）的填答合并为一行：姓名聚合、另加人数列。
+        # 典型异常（如全 5 分应付填答）在大团队里成批出现，合并后行数骤降
+        grouped = {}
+        for n, d, s, m in zip(name_s, dept_s, score_s, note_s):
+            grouped.setdefault((d, s, m), []).append(n)
+        if len(grouped) < len(name_s):
+            data = [None] * (len(grouped) + 1)
+            data[0] = [
+                _header_para(h, "table_cell_center", self.font_name)
+                for h in ("姓名", "部门", "统一分值", "人数", "说明")
             ]
-            for row in anomaly_rows:
-                name = row[0] if len(row) > 0 else ""
-                dept = row[1] if len(row) > 1 and row[1] is not None else "-"
-                score = row[2] if len(row) > 2 else ""
-                note = row[3] if len(row) > 3 else ""
-                score_str = "%.2f" % score if isinstance(score, (int, float)) else str(score)
-                data.append([
-                    Paragraph(escape(str(name)), cell_style),
-                    Paragraph(escape(str(dept)), cell_style),
-                    Paragraph(escape(score_str), cell_center),
-                    Paragraph(escape(str(note)), cell_style),
-                ])
-            t = Table(data, colWidths=[3 * cm, 3 * cm, 2.5 * cm, 6 * cm])
-            t.setStyle(TableStyle([
-                ("FONTNAME", (0, 0), (-1, -1), self.font_name or "Helvetica"),
-                ("FONTSIZE", (0, 0), (-1, -1), 9),
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#fff0f0")),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-            ]))
+            for i, ((d, s, m), names) in enumerate(grouped.items(), 1):
+                data[i] = [
+                    _row_para(_esc("、".join(names)), "table_cell", self.font_name),
+                    _fit_cell(d, _ANOM_COL_WIDTHS_MERGED[1], self.font_name),
+                    _fit_cell(s, _ANOM_COL_WIDTHS_MERGED[2], self.font_name, "table_cell_center"),
+                    str(len(names)),
+                    _fit_cell(m, _ANOM_COL_WIDTHS_MERGED[4], self.font_name),
+                ]
+            t = Table(data, colWidths=_ANOM_COL_WIDTHS_MERGED)
+            t.setStyle(_grid_style(self.font_name, "#fff0f0", valign="TOP"))
+            t.setStyle(_STYLE_ANOM_ALIGN_MERGED)
             story.append(t)
-        else:
-            story.append(Paragraph("当前无异常：未发现「全部题目同一分值」的填答。", self.styles["body"]))
+            return
+        # 行数极多时连网格表也放弃：按固定列位直绘字符串，超宽内容截断。
+        # 几百行以上对齐网格的视觉收益有限，排版成本却按行数线性放大
+        if len(name_s) > 300:
+            def _clip(s, n):
+                return s if len(s) <= n else s[: n - 1] + "…"
+            flat = [("姓名", "部门", "统一分值", "说明")]
+            flat += [
+                (_clip(n, 10), _clip(d, 10), s, _clip(m, 22))
+                for n, d, s, m in zip(name_s, dept_s, score_s, note_s)
+            ]
+            story.append(_FlatRowsFlowable(flat, self.font_name, (0, 3 * cm, 6 * cm, 8.5 * cm)))
+            story.append(Spacer(1, 0.3 * cm))
+            return
+        # 预分配行列表，按下标写入，免去 append 的扩容搬移
+        data = [None] * (len(name_s) + 1)
+        data[0] = [
+            _header_para("姓名", "table_cell_center", self.font_name),
+            _header_para("部门", "table_cell_center", self.font_name),
+            _header_para("统一分值", "table_cell_center", self.font_name),
+            _header_para("说明", "table_cell_center", self.font_name),
+        ]
+        for i, (n, d, s, m) in enumerate(zip(name_s, dept_s, score_s, note_s), 1):
+            # 列宽内的内容直接作单元格（免去 Paragraph 的 XML 解析与段落排版，
+            # 纯文本按原样绘制、无需转义），量宽放不下的回退 Paragraph 折行
+            data[i] = [
+                _fit_cell(n, _ANOM_COL_WIDTHS[0], self.font_name),
+                _fit_cell(d, _ANOM_COL_WIDTHS[1], self.font_name),
+                _fit_cell(s, _ANOM_COL_WIDTHS[2], self.font_name, "table_cell_center"),
+                _fit_cell(m, _ANOM_COL_WIDTHS[3], self.font_name),
+            ]
+        t = Table(data, colWidths=_ANOM_COL_WIDTHS)
+        t.setStyle(_grid_style(self.font_name, "#fff0f0", valign="TOP"))
+        t.setStyle(_STYLE_ANOM_ALIGN)
+        story.append(t)
 
-        self._background_path = self._resolve_background_path()
 
-        def _on_page(canvas, doc):
-            self._canvas_background(canvas, doc)
-            self._canvas_header(canvas, doc)
-        self.doc.build(story, onFirstPage=_on_page, onLaterPages=_on_page)
-        self.buffer.seek(0)
-        return self.buffer
+def _restore_streams(obj):
+    """把跨进程传输用的 bytes 还原为 BytesIO（build 的图像参数均按流消费）。"""
+    if isinstance(obj, (bytes, bytearray)):
+        return io.BytesIO(obj)
+    if isinstance(obj, list):
+        return [_restore_streams(v) for v in obj]
+    if isinstance(obj, tuple):
+        return tuple(_restore_streams(v) for v in obj)
+    if isinstance(obj, dict):
+        return {k: _restore_streams(v) for k, v in obj.items()}
+    return obj
+
+
+def _build_one(job: dict):
+    """单个批量任务：在（子）进程内构建一份报告，返回 PDF 字节。"""
+    report = PDFReport(job.get("app_dir"), job.get("report_type", "team"))
+    kwargs = _restore_streams(job.get("build_kwargs") or {})
+    return report.build(**kwargs).getvalue()
+
+
+def generate_many(jobs, max_workers=None):
+    """并行批量生成多份报告，返回与 jobs 同序的 PDF bytes 列表。
+
+    jobs: [{"app_dir":..., "report_type":..., "build_kwargs": {...}}, ...]
+    build_kwargs 中的图像请传 PNG 原始 bytes（而非 BytesIO），保证可跨进程
+    pickle，进入 build 前会自动还原为 BytesIO。reportlab 排版是纯 CPU 工作，
+    多份报告互相独立，按核数近线性扩展；单个任务直接在当前进程构建。
+    """
+    if not _ensure_reportlab():
+        raise RuntimeError("reportlab 未安装，请执行: pip install reportlab")
+    jobs = list(jobs)
+    if len(jobs) <= 1:
+        return [_build_one(j) for j in jobs]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as ex:
+        return list(ex.map(_build_one, jobs))